@@ -5,14 +5,20 @@ include field validators and OpenAPI examples for Swagger UI.
 """
 from __future__ import annotations
 
+import re
 from datetime import date
 from typing import Optional, Literal
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.core.dates import today as current_date
+
+
+_WORD_RE = re.compile(r"\S+")
+
 
 def _word_count(value: str) -> int:
-    return len([w for w in value.strip().split() if w])
+    return len(_WORD_RE.findall(value))
 
 
 class ProjectCreateRequest(BaseModel):
@@ -107,8 +113,7 @@ class TaskCreateRequest(BaseModel):
     def _validate_deadline(cls, v: Optional[date]) -> Optional[date]:
         if v is None:
             return v
-        today = date.today()
-        if v < today:
+        if v < current_date():
             raise ValueError("Deadline cannot be in the past")
         return v
 
@@ -154,8 +159,7 @@ class TaskUpdateRequest(BaseModel):
     def _validate_deadline(cls, v: Optional[date]) -> Optional[date]:
         if v is None:
             return v
-        today = date.today()
-        if v < today:
+        if v < current_date():
             raise ValueError("Deadline cannot be in the past")
         return v
 
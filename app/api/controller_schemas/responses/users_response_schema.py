@@ -1,7 +1,7 @@
 """Pydantic response schemas for Project and Task APIs.
 
-These models are configured with `ConfigDict(from_attributes=True)` so they
-can be constructed from SQLAlchemy ORM instances via `Model.model_validate(obj)`
+These models are configured with `ConfigDict(from_attributes=True)` (and are
+frozen, with extra fields forbidden) so they can be constructed from SQLAlchemy ORM instances via `Model.model_validate(obj)`
 or used with FastAPI's response_model which will honor attribute access.
 
 Example usage:
@@ -16,6 +16,10 @@ from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
+# Responses are built once and never mutated: frozen models skip assignment
+# checks, and forbidding extras rejects stray keys instead of carrying them
+_RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra="forbid")
+
 
 class TaskResponse(BaseModel):
     name: str
@@ -23,7 +27,7 @@ class TaskResponse(BaseModel):
     status: str
     deadline: Optional[date]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class ProjectResponse(BaseModel):
@@ -31,7 +35,7 @@ class ProjectResponse(BaseModel):
     description: Optional[str]
     tasks: List[TaskResponse] = []
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class ProjectSummary(BaseModel):
@@ -39,23 +43,23 @@ class ProjectSummary(BaseModel):
     description: Optional[str]
     task_count: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class ProjectListResponse(BaseModel):
     projects: List[ProjectSummary]
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class MessageResponse(BaseModel):
     message: str
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
 
 
 class ErrorResponse(BaseModel):
     detail: str
     error_type: str
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = _RESPONSE_CONFIG
@@ -1,9 +1,12 @@
 """FastAPI controllers for project and task endpoints."""
 
-from typing import List, Optional
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, status, Response
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Depends, Query, status, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.api.controller_schemas.requests.users_request_schema import (
@@ -14,23 +17,12 @@ from app.api.controller_schemas.requests.users_request_schema import (
     TaskUpdateRequest,
 )
 from app.api.controller_schemas.responses.users_response_schema import (
-    ErrorResponse,
     ProjectListResponse,
     ProjectResponse,
     ProjectSummary,
     TaskResponse,
 )
-from app.db.session import get_db
-from app.exceptions import (
-    DatabaseOperationError,
-    DuplicateProjectError,
-    DuplicateTaskError,
-    ProjectLimitError,
-    ProjectNotFoundError,
-    TaskLimitError,
-    TaskNotFoundError,
-    ValidationError,
-)
+from app.db.session import get_db, run_after_commit
 from app.repositories import ProjectRepository, TaskRepository
 from app.services import TodoService
 
@@ -38,28 +30,85 @@ from app.services import TodoService
 project_router = APIRouter()
 task_router = APIRouter()
 
+# List validators are built once at import and validate a whole batch per call
+_TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
+_PROJECT_SUMMARY_LIST_ADAPTER = TypeAdapter(List[ProjectSummary])
+
+
+# Process-wide cache of the project summaries served by GET /projects,
+# keyed by the requested (skip, limit) window. Mutating endpoints clear it
+# once their transaction has committed; the TTL bounds staleness from writes
+# made outside this process (other workers, the CLI, maintenance jobs).
+_PROJECT_SUMMARIES_TTL = 30.0
+_PROJECT_SUMMARIES_MAX_WINDOWS = 64
+_project_summaries: Dict[Tuple[int, Optional[int]], Tuple[float, List[ProjectSummary]]] = {}
+_project_summaries_lock = asyncio.Lock()
+# Bumped on every invalidation; a fetch that started under an older
+# generation may have read pre-write rows and is not cached
+_project_summaries_generation = 0
+
+
+def _invalidate_project_summaries() -> None:
+    """Drop the cached project summaries after a committed write."""
+    global _project_summaries_generation
+    _project_summaries_generation += 1
+    _project_summaries.clear()
+
+
+async def _get_project_summaries(
+    service: TodoService,
+    skip: int,
+    limit: Optional[int],
+) -> List[ProjectSummary]:
+    """Return cached summaries for a page, fetching that page once on a miss."""
+    key = (skip, limit)
+    entry = _project_summaries.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+    async with _project_summaries_lock:
+        # Another request may have fetched this page while we waited
+        entry = _project_summaries.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            generation = _project_summaries_generation
+            summaries = _PROJECT_SUMMARY_LIST_ADAPTER.validate_python(
+                [
+                    {
+                        "name": proj.name,
+                        "description": proj.description,
+                        "task_count": task_count,
+                    }
+                    for proj, task_count in service.list_projects_with_task_counts(offset=skip, limit=limit)
+                ]
+            )
+            if generation != _project_summaries_generation:
+                # A write committed while this page was read; serve it uncached
+                return summaries
+            # Arbitrary windows could grow the cache without bound; start over instead
+            if len(_project_summaries) >= _PROJECT_SUMMARIES_MAX_WINDOWS:
+                _project_summaries.clear()
+            entry = (time.monotonic() + _PROJECT_SUMMARIES_TTL, summaries)
+            _project_summaries[key] = entry
+        return entry[1]
 
-def get_todo_service(db: Session = Depends(get_db)) -> TodoService:
-    """Provide a TodoService with repository dependencies."""
-    project_repo = ProjectRepository(db)
-    task_repo = TaskRepository(db)
-    return TodoService(project_repo, task_repo)
 
+def invalidate_project_summaries_on_commit(db: Session = Depends(get_db, scope="function")) -> None:
+    """Clear the project summary cache once this request's writes commit.
 
-def _error_response(exc: Exception, default_status: int = status.HTTP_500_INTERNAL_SERVER_ERROR) -> JSONResponse:
-    """Translate service/repository exceptions into HTTP responses."""
-    status_code = default_status
-    if isinstance(exc, (ValidationError, ProjectLimitError, TaskLimitError)):
-        status_code = status.HTTP_400_BAD_REQUEST
-    elif isinstance(exc, (DuplicateProjectError, DuplicateTaskError)):
-        status_code = status.HTTP_409_CONFLICT
-    elif isinstance(exc, (ProjectNotFoundError, TaskNotFoundError)):
-        status_code = status.HTTP_404_NOT_FOUND
-    elif isinstance(exc, DatabaseOperationError):
-        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+    Shares the request's session with `get_todo_service`; nothing is cleared
+    if the transaction rolls back.
+    """
+    run_after_commit(db, _invalidate_project_summaries)
 
-    payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=status_code, content=payload.model_dump())
+
+def get_todo_service(db: Session = Depends(get_db, scope="function")) -> TodoService:
+    """Provide a TodoService with repository dependencies.
+
+    The session is function-scoped, so its commit happens before the
+    response is sent and commit failures are reported to the client.
+    """
+    project_repo = ProjectRepository(db)
+    task_repo = TaskRepository(db)
+    return TodoService(project_repo, task_repo)
 
 
 @project_router.post(
@@ -68,16 +117,14 @@ def _error_response(exc: Exception, default_status: int = status.HTTP_500_INTERN
     status_code=status.HTTP_201_CREATED,
     summary="Create a new project",
     description="Create a project with a name and optional description.",
+    dependencies=[Depends(invalidate_project_summaries_on_commit)],
 )
 async def create_project(
     request: ProjectCreateRequest,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        project = service.create_project(request.name, request.description or "")
-        return ProjectResponse.model_validate(project)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    project = service.create_project(request.name, request.description or "")
+    return ProjectResponse.model_validate(project)
 
 
 @project_router.get(
@@ -87,27 +134,12 @@ async def create_project(
     description="List all projects with optional pagination.",
 )
 async def list_projects(
-    skip: int = 0,
-    limit: Optional[int] = None,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=0),
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        projects = service.list_projects()
-        sliced = projects[skip:] if skip else projects
-        if limit is not None:
-            sliced = sliced[:limit]
-        summaries: List[ProjectSummary] = []
-        for proj in sliced:
-            summaries.append(
-                ProjectSummary(
-                    name=proj.name,
-                    description=proj.description,
-                    task_count=len(getattr(proj, "tasks", []) or []),
-                )
-            )
-        return ProjectListResponse(projects=summaries)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    summaries = await _get_project_summaries(service, skip, limit)
+    return ProjectListResponse(projects=summaries)
 
 
 @project_router.get(
@@ -120,11 +152,8 @@ async def get_project(
     project_id: int,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        project = service.get_project(project_id)
-        return ProjectResponse.model_validate(project)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    project = service.get_project_with_tasks(project_id)
+    return ProjectResponse.model_validate(project)
 
 
 @project_router.put(
@@ -132,20 +161,19 @@ async def get_project(
     response_model=ProjectResponse,
     summary="Update a project",
     description="Update project name and description.",
+    dependencies=[Depends(invalidate_project_summaries_on_commit)],
 )
 async def update_project(
     project_id: int,
     request: ProjectUpdateRequest,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        existing = service.get_project(project_id)
-        new_name = request.new_name or existing.name
-        new_description = request.new_description or existing.description or ""
-        project = service.edit_project(project_id, new_name, new_description)
-        return ProjectResponse.model_validate(project)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    project = service.patch_project(
+        project_id,
+        request.new_name or None,
+        request.new_description or None,
+    )
+    return ProjectResponse.model_validate(project)
 
 
 @project_router.delete(
@@ -154,16 +182,14 @@ async def update_project(
     response_model=None,
     summary="Delete a project",
     description="Delete a project by ID.",
+    dependencies=[Depends(invalidate_project_summaries_on_commit)],
 )
 async def delete_project(
     project_id: int,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        service.delete_project(project_id)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    service.delete_project(project_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
 @task_router.post(
@@ -172,24 +198,22 @@ async def delete_project(
     status_code=status.HTTP_201_CREATED,
     summary="Create a task",
     description="Create a new task within a project.",
+    dependencies=[Depends(invalidate_project_summaries_on_commit)],
 )
 async def create_task(
     project_id: int,
     request: TaskCreateRequest,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        deadline_str = request.deadline.isoformat() if request.deadline else None
-        task = service.create_task(
-            project_id,
-            request.name,
-            request.description or "",
-            request.status,
-            deadline_str,
-        )
-        return TaskResponse.model_validate(task)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    deadline_str = request.deadline.isoformat() if request.deadline else None
+    task = service.create_task(
+        project_id,
+        request.name,
+        request.description or "",
+        request.status,
+        deadline_str,
+    )
+    return TaskResponse.model_validate(task)
 
 
 @task_router.get(
@@ -202,11 +226,9 @@ async def list_tasks(
     project_id: int,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        tasks = service.list_tasks(project_id)
-        return [TaskResponse.model_validate(t) for t in tasks]
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    tasks = _TASK_LIST_ADAPTER.validate_python(service.list_tasks(project_id), from_attributes=True)
+    # Hand the dumped list straight to orjson, skipping FastAPI's re-serialization pass
+    return ORJSONResponse(content=_TASK_LIST_ADAPTER.dump_python(tasks, mode="json"))
 
 
 @task_router.get(
@@ -220,11 +242,8 @@ async def get_task(
     task_id: int,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        task = service.get_task(project_id, task_id)
-        return TaskResponse.model_validate(task)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    task = service.get_task(project_id, task_id)
+    return TaskResponse.model_validate(task)
 
 
 @task_router.put(
@@ -239,26 +258,16 @@ async def update_task(
     request: TaskUpdateRequest,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        existing = service.get_task(project_id, task_id)
-        new_name = request.name or existing.name
-        new_description = request.description or existing.description or ""
-        new_status = request.status or existing.status
-        deadline_str = request.deadline.isoformat() if request.deadline else (
-            existing.deadline.isoformat() if existing.deadline else None
-        )
-
-        task = service.edit_task(
-            project_id,
-            task_id,
-            new_name,
-            new_description,
-            new_status,
-            deadline_str,
-        )
-        return TaskResponse.model_validate(task)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    deadline_str = request.deadline.isoformat() if request.deadline else None
+    task = service.patch_task(
+        project_id,
+        task_id,
+        request.name or None,
+        request.description or None,
+        request.status or None,
+        deadline_str,
+    )
+    return TaskResponse.model_validate(task)
 
 
 @task_router.patch(
@@ -273,11 +282,8 @@ async def update_task_status(
     request: TaskStatusUpdateRequest,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        task = service.edit_task_status(project_id, task_id, request.status)
-        return TaskResponse.model_validate(task)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    task = service.edit_task_status(project_id, task_id, request.status)
+    return TaskResponse.model_validate(task)
 
 
 @task_router.delete(
@@ -286,14 +292,12 @@ async def update_task_status(
     response_model=None,
     summary="Delete a task",
     description="Delete a task from a project.",
+    dependencies=[Depends(invalidate_project_summaries_on_commit)],
 )
 async def delete_task(
     project_id: int,
     task_id: int,
     service: TodoService = Depends(get_todo_service),
 ):
-    try:
-        service.delete_task(project_id, task_id)
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
-    except Exception as exc:  # noqa: BLE001
-        return _error_response(exc)
+    service.delete_task(project_id, task_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -2,6 +2,7 @@ from .menus import (
     display_main_menu,
     display_add_project_menu,
     display_add_task_menu,
+    display_add_task_menu_batch,
     display_edit_project_menu,
     display_edit_task_menu,
     display_edit_task_status_menu,
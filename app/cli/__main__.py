@@ -1,38 +1,99 @@
 """CLI entry point for the todo application using repository-backed services."""
-from typing import List
+from __future__ import annotations
+
+import asyncio
+from functools import wraps
+from itertools import chain, groupby
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Collection, Dict, Iterable, List, Optional, TypeVar
 import sys
 
-from app.cli.utils import handle_application_error, display_error, confirm_action
+from app.cli.utils import (
+    INTERACTIVE,
+    confirm_action,
+    display_error,
+    handle_application_error,
+    read_line,
+    run_blocking,
+)
 from app.cli import (
     display_main_menu,
     display_add_project_menu,
     display_add_task_menu,
+    display_add_task_menu_batch,
     display_edit_project_menu,
     display_edit_task_menu,
     display_edit_task_status_menu,
     display_welcome,
 )
+from app.exceptions import DatabaseOperationError
 
-from app.db.session import get_db
-from app.repositories import ProjectRepository, TaskRepository
-from app.services import ProjectService, TaskService
+# The data layer (SQLAlchemy, engine, repositories) is imported inside main(),
+# after the banner is printed, so the CLI starts without paying for it up front
+if TYPE_CHECKING:
+    from sqlalchemy import Row
+    from sqlalchemy.orm import Session
 
+    from app.services import ProjectService, TaskService
+
+
+T = TypeVar("T")
+
+_NO_PROJECTS_MSG = "No projects exist yet. Please create a project first.\n"
+
+
+def _format_id_name(item) -> str:
+    return f"{item.id}. {item.name}\n"
 
-def _read_int(prompt: str) -> int:
-    while True:
-        raw = input(prompt)
-        try:
-            return int(raw)
-        except ValueError:
-            print("Invalid input! Please enter a number.")
 
+def _format_task_status(task) -> str:
+    return f"{task.id}. {task.name} (current status: {task.status})\n"
 
-def _choose_id(prompt: str, valid_ids: List[int]) -> int:
+
+# Row templates for the "View all" listings, bound once at import
+_format_project_line = "{}. {} - {} | Tasks: {}\n".format
+_format_task_line = "  {}. {} - {} | Status: {} | Deadline: {}\n".format
+
+# Reads every task field the row template needs in one C-level call
+_task_line_fields = attrgetter("id", "name", "description", "status", "deadline")
+_task_project_id = attrgetter("project_id")
+
+
+def _write_listing(items: Iterable[Any], fmt: Callable[[Any], str], header: Optional[str] = None) -> None:
+    """Write an optional header line and one line per item to stdout in a single call."""
+    lines = map(fmt, items)
+    sys.stdout.writelines(lines if header is None else chain((f"{header}\n",), lines))
+
+
+def _read_int(prompt: str) -> int:
+    # Bind the stream methods once; this loop re-prompts until it gets a number
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    readline = sys.stdin.readline
+    while True:
+        if INTERACTIVE:
+            write(prompt)
+        flush()
+        raw = readline()
+        if not raw:
+            raise EOFError
+        digits = raw.strip()
+        # Single-digit IDs are the common case; decode them without int()
+        if len(digits) == 1 and "0" <= digits <= "9":
+            return ord(digits) - 48
+        # Check the characters up front so bad input never raises inside int()
+        unsigned = digits[1:] if digits.startswith(("-", "+")) else digits
+        if unsigned.isdecimal():
+            return int(digits)
+        write("Invalid input! Please enter a number.\n")
+
+
+def _choose_id(prompt: str, valid_ids: Collection[int]) -> int:
     """Prompt the user to choose a numeric ID present in `valid_ids`.
 
     Args:
         prompt: Input prompt to show the user.
-        valid_ids: List of allowed integer IDs.
+        valid_ids: Allowed integer IDs; pass dict keys or a set for O(1) membership checks.
 
     Returns:
         The chosen integer ID.
@@ -46,17 +107,379 @@ def _choose_id(prompt: str, valid_ids: List[int]) -> int:
         choice = _read_int(prompt)
         if choice in valid_ids:
             return choice
-        print(f"Please enter one of the following IDs: {', '.join(map(str, valid_ids))}.")
+        sys.stdout.write(f"Please enter one of the following IDs: {', '.join(map(str, valid_ids))}.\n")
+
+
+class _ProjectMenuCache:
+    """Snapshot of the project list and its rendered selection menu.
+
+    The snapshot is fetched and formatted once, then reused by every menu
+    option that asks for a project until `invalidate()` is called after a
+    project is created, edited or deleted.
+    """
+
+    def __init__(self) -> None:
+        self._projects: Optional[List[Row]] = None
+        self._by_id: Dict[int, Row] = {}
+        self._menu = ""
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale so the next `list()` refetches it."""
+        self._projects = None
+
+    def list(self, project_service: ProjectService) -> List[Row]:
+        """Return the cached (id, name) project rows, refetching them if stale."""
+        if self._projects is None:
+            projects = project_service.list_project_summaries()
+            self._by_id = {p.id: p for p in projects}
+            self._menu = "".join(map(_format_id_name, projects))
+            self._projects = projects
+        return self._projects
+
+    def prompt_select(self, header: str) -> Row:
+        """List the cached projects under `header` and let the user pick one by ID.
+
+        Must be called after `list()` has returned a non-empty snapshot.
+        """
+        # Header and menu go out as one write; the prompt read flushes it
+        sys.stdout.write(f"{header}\n{self._menu}")
+        return self._by_id[_choose_id("Enter project ID: ", self._by_id.keys())]
+
+
+_project_menu = _ProjectMenuCache()
+
+
+def _requires_projects(handler: Callable[..., Any]) -> Callable[[ProjectService, TaskService, Session], Any]:
+    """Run `handler` only when at least one project exists.
+
+    The check reads the cached project snapshot, which the handler then
+    selects from via `_project_menu.prompt_select`.
+    """
+
+    @wraps(handler)
+    def wrapper(project_service: ProjectService, task_service: TaskService, db: Session) -> Any:
+        if not _project_menu.list(project_service):
+            sys.stdout.write(_NO_PROJECTS_MSG)
+            return None
+        return handler(project_service, task_service, db)
+
+    return wrapper
+
+
+def _commit_write(db: Session, func: Callable[..., T], *args: Any) -> T:
+    """Run one service write and commit it before the caller reports success.
+
+    Repositories only flush, so the write is not durable until this commit.
+    A failed commit is rolled back and raised as `DatabaseOperationError`;
+    call this through `handle_application_error` so the menu carries on.
+    """
+    result = func(*args)
+    try:
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        # The rollback expired whatever the cached project menu was built from
+        _project_menu.invalidate()
+        raise DatabaseOperationError(f"Failed to commit transaction: {e}") from e
+    return result
+
+
+def _select_task(
+    task_service: TaskService,
+    project_id: int,
+    header: str,
+    fmt: Callable[[Any], str],
+) -> Optional[Row]:
+    """List the tasks of a project and let the user pick one by ID.
+
+    Args:
+        task_service: Service used to fetch the tasks.
+        project_id: ID of the project whose tasks are listed.
+        header: Line printed above the task listing.
+        fmt: Formatter applied to each task row.
 
+    Returns:
+        The chosen (id, name, status) task row, or None if the project has no tasks.
+    """
+    tasks = task_service.list_task_summaries(project_id)
+    if not tasks:
+        print("No tasks exist in this project yet. Please add a task first.")
+        return None
+
+    _write_listing(tasks, fmt, header)
+    by_id = {t.id: t for t in tasks}
+    return by_id[_choose_id("Enter task ID: ", by_id.keys())]
+
+
+def _handle_add_project(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    name, description = display_add_project_menu()
+    project = handle_application_error(_commit_write, db, project_service.create_project, name, description)
+    if project is not None:
+        _project_menu.invalidate()
+        print(f"Project {project.name} created successfully (ID: {project.id})")
+
+
+@_requires_projects
+def _handle_add_task(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    project = _project_menu.prompt_select("Select a project (enter the project ID):")
+    project_id = project.id
+
+    # Typed input goes field by field unless the user opts to paste a block;
+    # piped input supplies the four lines as a block without prompts
+    batch = not INTERACTIVE or confirm_action("Paste all four task fields at once?")
+    read_task_fields = display_add_task_menu_batch if batch else display_add_task_menu
+    name, description, status, deadline = read_task_fields()
+    task = handle_application_error(
+        _commit_write,
+        db,
+        task_service.create_task,
+        project_id,
+        name,
+        description,
+        status,
+        deadline,
+    )
+    if task is not None:
+        print(f"Task {task.name} added successfully to project {project.name} (Task ID: {task.id})")
+
+
+@_requires_projects
+def _handle_edit_project(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    project = _project_menu.prompt_select("Select a project to edit (enter the project ID):")
+    project_id = project.id
+
+    new_name, new_description = display_edit_project_menu()
+    project = handle_application_error(
+        _commit_write,
+        db,
+        project_service.edit_project,
+        project_id,
+        new_name,
+        new_description,
+    )
+    if project is not None:
+        _project_menu.invalidate()
+        print(f"Project {project.name} edited successfully")
+
+
+@_requires_projects
+def _handle_edit_task(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    project = _project_menu.prompt_select("Select a project (enter the project ID):")
+    project_id = project.id
+    task = _select_task(task_service, project_id, "Select a task to edit (enter the task ID):", _format_id_name)
+    if task is None:
+        return
+    task_id = task.id
+
+    new_name, new_description, new_status, new_deadline = display_edit_task_menu()
+    task = handle_application_error(
+        _commit_write,
+        db,
+        task_service.edit_task,
+        project_id,
+        task_id,
+        new_name,
+        new_description,
+        new_status,
+        new_deadline,
+    )
+    if task is not None:
+        print(f"Task {task.name} edited successfully in project {project.name}")
+
+
+@_requires_projects
+def _handle_edit_task_status(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    project = _project_menu.prompt_select("Select a project (enter the project ID):")
+    project_id = project.id
+    task = _select_task(
+        task_service,
+        project_id,
+        "Select a task to update status (enter the task ID):",
+        _format_task_status,
+    )
+    if task is None:
+        return
+    task_id = task.id
+
+    new_status = display_edit_task_status_menu()
+    task = handle_application_error(_commit_write, db, task_service.edit_task_status, project_id, task_id, new_status)
+    if task is not None:
+        print(f"Task {task.name} status edited successfully in project {project.name}")
+
+
+@_requires_projects
+def _handle_delete_project(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    project = _project_menu.prompt_select("Select a project to delete (enter the project ID):")
+    project_id, project_name = project.id, project.name
+
+    if confirm_action(f"Are you sure you want to delete project '{project_name}'? This will delete all its tasks"):
+        result = handle_application_error(_commit_write, db, project_service.delete_project, project_id)
+        _project_menu.invalidate()
+        if result is not None:
+            print(f"Project {project_name} deleted successfully")
+
+
+@_requires_projects
+def _handle_delete_task(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    project = _project_menu.prompt_select("Select a project (enter the project ID):")
+    project_id = project.id
+    task = _select_task(task_service, project_id, "Select a task to delete (enter the task ID):", _format_id_name)
+    if task is None:
+        return
+    task_id, task_name, project_name = task.id, task.name, project.name
+
+    if confirm_action(f"Are you sure you want to delete task '{task_name}' from project '{project_name}'?"):
+        if handle_application_error(_commit_write, db, task_service.delete_task, project_id, task_id) is not None:
+            print(f"Task {task_name} deleted successfully from project {project_name}")
+
+
+# Rows shown per page by the "View all" listings
+_PAGE_SIZE = 50
+
+
+def _page_through(
+    header: str,
+    fetch_page: Callable[[int, int], List[Any]],
+    write_page: Callable[[List[Any]], None],
+) -> bool:
+    """Fetch and write a listing one page at a time.
+
+    Interactive users move between pages with n/p; any other answer leaves
+    the listing. Piped input gets every page in turn without prompts, so
+    scripted menu choices are not consumed by the pager.
 
-def main():
+    Args:
+        header: Line written once above the first page.
+        fetch_page: Called as `fetch_page(offset, limit)` to load one page.
+        write_page: Writes the rows of one page.
+
+    Returns:
+        False if there was nothing to list, True otherwise.
+    """
+    offset = 0
+    while True:
+        # Ask for one extra row to learn whether a next page exists
+        rows = fetch_page(offset, _PAGE_SIZE + 1)
+        if not rows and offset == 0:
+            return False
+        if header:
+            sys.stdout.write(f"{header}\n")
+            header = ""
+        has_next = len(rows) > _PAGE_SIZE
+        write_page(rows[:_PAGE_SIZE])
+
+        if not INTERACTIVE:
+            if not has_next:
+                return True
+            offset += _PAGE_SIZE
+            continue
+        if not has_next and offset == 0:
+            return True
+
+        options = []
+        if has_next:
+            options.append("n = next page")
+        if offset:
+            options.append("p = previous page")
+        choice = read_line(f"[{', '.join(options)}, Enter = back]: ").strip().lower()
+        if choice == "n" and has_next:
+            offset += _PAGE_SIZE
+        elif choice == "p" and offset:
+            offset -= _PAGE_SIZE
+        else:
+            return True
+
+
+def _handle_view_projects(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    def fetch_page(offset: int, limit: int) -> List[Any]:
+        # Task counts come from one GROUP BY query rather than loading each project's tasks
+        return project_service.list_projects_with_task_counts(offset=offset, limit=limit)
+
+    def write_page(rows: List[Any]) -> None:
+        sys.stdout.writelines(
+            [_format_project_line(p.id, p.name, p.description, task_count) for p, task_count in rows]
+        )
+
+    if not _page_through("All projects:", fetch_page, write_page):
+        print("No projects to display.")
+
+
+def _iter_task_lines(tasks: Iterable[Any], continued_pid: Optional[int] = None) -> Iterable[str]:
+    """Yield the 'View all tasks' lines for tasks already ordered by project.
+
+    `continued_pid` is the project whose tasks ended the previously written
+    page; its header is not repeated when the listing continues with it.
+    """
+    for pid, group in groupby(tasks, key=_task_project_id):
+        first = next(group)
+        if pid != continued_pid:
+            project = first.project
+            proj_name = project.name if project else str(pid)
+            yield f"Project: {proj_name} (ID: {pid})\n"
+        continued_pid = None
+        for t in chain((first,), group):
+            yield _format_task_line(*_task_line_fields(t))
+
+
+def _handle_view_tasks(project_service: ProjectService, task_service: TaskService, db: Session) -> None:
+    def fetch_page(offset: int, limit: int) -> List[Any]:
+        # One JOINed query per page, already ordered by project, so rows group in a single pass
+        return task_service.list_all_tasks_with_projects(offset=offset, limit=limit)
+
+    last_pid: Optional[int] = None
+
+    def write_page(tasks: List[Any]) -> None:
+        nonlocal last_pid
+        # Piped output runs pages together, so a project split across a page
+        # boundary keeps a single header; interactive pages stand alone
+        continued_pid = None if INTERACTIVE else last_pid
+        sys.stdout.writelines(_iter_task_lines(tasks, continued_pid))
+        if tasks:
+            last_pid = _task_project_id(tasks[-1])
+
+    if not _page_through("All tasks:", fetch_page, write_page):
+        print("No tasks to display.")
+
+
+def _handle_exit(project_service: ProjectService, task_service: TaskService, db: Session) -> object:
+    print("Exiting... See you!")
+    return _EXIT
+
+
+# Sentinel returned by a handler to leave the main loop
+_EXIT = object()
+
+_HANDLERS = {
+    1: _handle_add_project,
+    2: _handle_add_task,
+    3: _handle_edit_project,
+    4: _handle_edit_task,
+    5: _handle_edit_task_status,
+    6: _handle_delete_project,
+    7: _handle_delete_task,
+    8: _handle_view_projects,
+    9: _handle_view_tasks,
+    10: _handle_exit,
+}
+
+_VALID_OPTIONS = frozenset(_HANDLERS)
+
+
+async def main():
     # Deprecation notice (visible but non-blocking)
     print("\nWARNING: The CLI is deprecated and will be removed in the next version.", file=sys.stderr)
     print("Please use the new REST API instead: http://localhost:8000", file=sys.stderr)
     print("API documentation: http://localhost:8000/docs\n", file=sys.stderr)
 
-    # Obtain a DB session from the generator
-    db = next(get_db())
+    # Block-buffer stdout; every prompt flushes pending output before reading
+    sys.stdout.reconfigure(line_buffering=False)
+
+    from app.db.session import SessionLocal
+    from app.repositories import ProjectRepository, TaskRepository
+    from app.services import ProjectService, TaskService
+
+    # One session for the whole run; each menu write commits on its own
+    db = SessionLocal()
 
     try:
         # Initialize repositories and services (dependency injection)
@@ -68,264 +491,36 @@ def main():
 
         display_welcome()
 
+        # Menus and handlers block on stdin, so each step runs off the event loop
         while True:
-            main_menu_option = display_main_menu()
-
-            if main_menu_option == 1:
-                name, description = display_add_project_menu()
-                project = handle_application_error(project_service.create_project, name, description)
-                if project is not None:
-                    print(f"Project {project.name} created successfully (ID: {project.id})")
-                continue
-
-            elif main_menu_option == 2:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects exist yet. Please create a project first.")
-                    continue
-
-                print("Select a project (enter the project ID):")
-                ids = []
-                for p in projects:
-                    ids.append(p.id)
-                    print(f"{p.id}. {p.name}")
-                project_id = _choose_id("Enter project ID: ", ids)
-
-                name, description, status, deadline = display_add_task_menu()
-                task = handle_application_error(
-                    task_service.create_task,
-                    project_id,
-                    name,
-                    description,
-                    status,
-                    deadline,
-                )
-                if task is not None:
-                    proj = handle_application_error(project_service.get_project, project_id)
-                    proj_name = proj.name if proj is not None else str(project_id)
-                    print(f"Task {task.name} added successfully to project {proj_name} (Task ID: {task.id})")
-                continue
-
-            elif main_menu_option == 3:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects exist yet. Please create a project first.")
-                    continue
-
-                print("Select a project to edit (enter the project ID):")
-                ids = []
-                for p in projects:
-                    ids.append(p.id)
-                    print(f"{p.id}. {p.name}")
-                project_id = _choose_id("Enter project ID: ", ids)
-
-                new_name, new_description = display_edit_project_menu()
-                project = handle_application_error(
-                    project_service.edit_project,
-                    project_id,
-                    new_name,
-                    new_description,
-                )
-                if project is not None:
-                    print(f"Project {project.name} edited successfully")
+            main_menu_option = await run_blocking(display_main_menu)
+            if main_menu_option not in _VALID_OPTIONS:
+                print("Invalid option! Please enter a number from the options above.")
                 continue
-
-            elif main_menu_option == 4:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects exist yet. Please create a project first.")
-                    continue
-
-                print("Select a project (enter the project ID):")
-                ids = []
-                for p in projects:
-                    ids.append(p.id)
-                    print(f"{p.id}. {p.name}")
-                project_id = _choose_id("Enter project ID: ", ids)
-
-                tasks = task_service.list_tasks(project_id)
-                if not tasks:
-                    print("No tasks exist in this project yet. Please add a task first.")
-                    continue
-
-                print("Select a task to edit (enter the task ID):")
-                task_ids = []
-                for t in tasks:
-                    task_ids.append(t.id)
-                    print(f"{t.id}. {t.name}")
-                task_id = _choose_id("Enter task ID: ", task_ids)
-
-                new_name, new_description, new_status, new_deadline = display_edit_task_menu()
-                task = handle_application_error(
-                    task_service.edit_task,
-                    project_id,
-                    task_id,
-                    new_name,
-                    new_description,
-                    new_status,
-                    new_deadline,
-                )
-                if task is not None:
-                    proj = handle_application_error(project_service.get_project, project_id)
-                    proj_name = proj.name if proj is not None else str(project_id)
-                    print(f"Task {task.name} edited successfully in project {proj_name}")
-                continue
-
-            elif main_menu_option == 5:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects exist yet. Please create a project first.")
-                    continue
-
-                print("Select a project (enter the project ID):")
-                ids = []
-                for p in projects:
-                    ids.append(p.id)
-                    print(f"{p.id}. {p.name}")
-                project_id = _choose_id("Enter project ID: ", ids)
-
-                tasks = task_service.list_tasks(project_id)
-                if not tasks:
-                    print("No tasks exist in this project yet. Please add a task first.")
-                    continue
-
-                print("Select a task to update status (enter the task ID):")
-                task_ids = []
-                for t in tasks:
-                    task_ids.append(t.id)
-                    print(f"{t.id}. {t.name} (current status: {t.status})")
-                task_id = _choose_id("Enter task ID: ", task_ids)
-
-                new_status = display_edit_task_status_menu()
-                task = handle_application_error(task_service.edit_task_status, project_id, task_id, new_status)
-                if task is not None:
-                    proj = handle_application_error(project_service.get_project, project_id)
-                    proj_name = proj.name if proj is not None else str(project_id)
-                    print(f"Task {task.name} status edited successfully in project {proj_name}")
-                continue
-
-            elif main_menu_option == 6:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects exist yet. Please create a project first.")
-                    continue
-
-                print("Select a project to delete (enter the project ID):")
-                ids = []
-                for p in projects:
-                    ids.append(p.id)
-                    print(f"{p.id}. {p.name}")
-                project_id = _choose_id("Enter project ID: ", ids)
-                project = handle_application_error(project_service.get_project, project_id)
-
-                if project is None:
-                    continue
-
-                if confirm_action(f"Are you sure you want to delete project '{project.name}'? This will delete all its tasks"):
-                    if handle_application_error(project_service.delete_project, project_id) is not None:
-                        print(f"Project {project.name} deleted successfully")
-                continue
-
-            elif main_menu_option == 7:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects exist yet. Please create a project first.")
-                    continue
-
-                print("Select a project (enter the project ID):")
-                ids = []
-                for p in projects:
-                    ids.append(p.id)
-                    print(f"{p.id}. {p.name}")
-                project_id = _choose_id("Enter project ID: ", ids)
-
-                tasks = task_service.list_tasks(project_id)
-                if not tasks:
-                    print("No tasks exist in this project yet. Please add a task first.")
-                    continue
-
-                print("Select a task to delete (enter the task ID):")
-                task_ids = []
-                for t in tasks:
-                    task_ids.append(t.id)
-                    print(f"{t.id}. {t.name}")
-                task_id = _choose_id("Enter task ID: ", task_ids)
-
-                task = None
-                for t in tasks:
-                    if t.id == task_id:
-                        task = t
-                        break
-                project = handle_application_error(project_service.get_project, project_id)
-
-                if task is None or project is None:
-                    continue
-
-                if confirm_action(f"Are you sure you want to delete task '{task.name}' from project '{project.name}'?"):
-                    if handle_application_error(task_service.delete_task, project_id, task_id) is not None:
-                        print(f"Task {task.name} deleted successfully from project {project.name}")
-                continue
-
-            elif main_menu_option == 8:
-                projects = project_service.list_projects()
-                if not projects:
-                    print("No projects to display.")
-                    continue
-
-                print("All projects:")
-                for p in projects:
-                    print(f"{p.id}. {p.name} - {p.description} | Tasks: {len(p.tasks)}")
-
-            elif main_menu_option == 9:
-                tasks = task_service.list_all_tasks()
-                if not tasks:
-                    print("No tasks to display.")
-                    continue
-
-                print("All tasks:")
-                current_project = None
-                for t in tasks:
-                    proj_name = t.project.name if getattr(t, "project", None) else "<unknown>"
-                    print(f"Project: {proj_name} (Project ID: {t.project_id})")
-                    break
-                # Group by project for display
-                grouped = {}
-                for t in tasks:
-                    grouped.setdefault(t.project_id, []).append(t)
-
-                for pid, tlist in grouped.items():
-                    proj_name = tlist[0].project.name if getattr(tlist[0], "project", None) else str(pid)
-                    print(f"Project: {proj_name} (ID: {pid})")
-                    for t in tlist:
-                        print(f"  {t.id}. {t.name} - {t.description} | Status: {t.status} | Deadline: {t.deadline}")
-
-            elif main_menu_option == 10:
-                print("Exiting... See you!")
+            handler = _HANDLERS[main_menu_option]
+            if await run_blocking(handler, project_service, task_service, db) is _EXIT:
                 break
 
-    except KeyboardInterrupt:
-        # Ensure any open transaction is rolled back on user interrupt
-        try:
-            db.rollback()
-        except Exception:
-            pass
-        print("\nProgram interrupted by user. Exiting...")
     except Exception as e:
         try:
             db.rollback()
         except Exception:
             pass
         display_error(f"Unexpected error occurred: {str(e)}")
-    finally:
-        try:
-            db.close()
-        except Exception:
-            pass
+
+    # Not reached on KeyboardInterrupt/CancelledError: the worker thread may
+    # still be inside a handler using the session, and a Session is not
+    # thread-safe, so it is left alone; the uncommitted transaction is
+    # discarded when the process exits and drops the connection
+    try:
+        db.close()
+    except Exception:
+        pass
 
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
     except KeyboardInterrupt:
         print("\nProgram interrupted by user. Exiting...")
     except Exception as e:
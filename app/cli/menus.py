@@ -1,21 +1,74 @@
+import io
+import os
+import sys
+
+from app.cli.utils import INTERACTIVE, read_line
+
+# Static banners are pre-encoded and written straight to the stdout fd
+_WELCOME = b"Welcome to the To-Do List Application!\n"
+
+_MAIN_MENU = (
+    "Please select an option:\n"
+    "1. Add a new project\n"
+    "2. Add a new task\n"
+    "3. Edit a project\n"
+    "4. Edit a task\n"
+    "5. Edit task status\n"
+    "6. Delete a project\n"
+    "7. Delete a task\n"
+    "8. View all projects\n"
+    "9. View all tasks\n"
+    "10. Exit\n"
+).encode("utf-8")
+
+# Menu choices as typed, mapped to their option number
+_MENU_CHOICES = {str(i): i for i in range(1, 11)}
+
+_PROJECT_NAME_PROMPT = "Please enter the project name:\n"
+_PROJECT_DESCRIPTION_PROMPT = "Please enter the project description:\n"
+_TASK_NAME_PROMPT = "Please enter the task name:\n"
+_TASK_DESCRIPTION_PROMPT = "Please enter the task description:\n"
+_TASK_STATUS_PROMPT = "Please enter the task status:\n"
+_TASK_DEADLINE_PROMPT = "Please enter the task deadline:\n"
+_TASK_BATCH_PROMPT = (
+    "Please enter the task name, description, status and deadline, one per line\n"
+    "(leave a line empty to skip an optional field):\n"
+)
+_NEW_PROJECT_NAME_PROMPT = "Enter new project name:\n"
+_NEW_PROJECT_DESCRIPTION_PROMPT = "Enter new project description:\n"
+_NEW_TASK_NAME_PROMPT = "Enter new task name:\n"
+_NEW_TASK_DESCRIPTION_PROMPT = "Enter new task description:\n"
+_NEW_TASK_STATUS_PROMPT = "Enter new task status:\n"
+_NEW_TASK_DEADLINE_PROMPT = "Enter new task deadline:\n"
+
+
+def _write_bytes(data: bytes) -> None:
+    # Flush buffered text first so earlier output keeps its order, then
+    # hand the bytes straight to the stdout file descriptor
+    sys.stdout.flush()
+    try:
+        fd = sys.stdout.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        # stdout replaced by an in-memory stream (tests, embedding)
+        sys.stdout.write(data.decode("utf-8"))
+        return
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
 def display_welcome():
-    print("Welcome to the To-Do List Application!")
+    _write_bytes(_WELCOME)
 
 
 def display_main_menu():
-    print("Please select an option:")
-    print("1. Add a new project")
-    print("2. Add a new task")
-    print("3. Edit a project")
-    print("4. Edit a task")
-    print("5. Edit task status")
-    print("6. Delete a project")
-    print("7. Delete a task")
-    print("8. View all projects")
-    print("9. View all tasks")
-    print("10. Exit")
+    if INTERACTIVE:
+        _write_bytes(_MAIN_MENU)
     while True:
-        option = input("Enter your choice: ")
+        option = read_line("Enter your choice: ")
+        choice = _MENU_CHOICES.get(option.strip())
+        if choice is not None:
+            return choice
         try:
             return int(option)
         except ValueError:
@@ -23,48 +76,50 @@ def display_main_menu():
 
 
 def display_add_project_menu():
-    print("Please enter the project name:")
-    name = input()
-    print("Please enter the project description:")
-    description = input()
+    name = read_line(_PROJECT_NAME_PROMPT)
+    description = read_line(_PROJECT_DESCRIPTION_PROMPT)
     return name, description
 
 
 def display_add_task_menu():
-    print("Please enter the task name:")
-    name = input()
-    print("Please enter the task description:")
-    description = input()
-    print("Please enter the task status:")
-    status = input()
-    print("Please enter the task deadline:")
-    deadline = input()
+    name = read_line(_TASK_NAME_PROMPT)
+    description = read_line(_TASK_DESCRIPTION_PROMPT)
+    status = read_line(_TASK_STATUS_PROMPT)
+    deadline = read_line(_TASK_DEADLINE_PROMPT)
+    return name, description, status, deadline
+
+
+def display_add_task_menu_batch():
+    """Read all four task fields as one block of lines.
+
+    The field prompts are written as a single block up front, and skipped
+    entirely when stdin is not a terminal (piped or scripted input).
+    """
+    if INTERACTIVE:
+        sys.stdout.write(_TASK_BATCH_PROMPT)
+    name = read_line()
+    description = read_line()
+    status = read_line()
+    deadline = read_line()
     return name, description, status, deadline
 
 
 def display_edit_project_menu():
-    print("Enter new project name:")
-    new_name = input()
-    print("Enter new project description:")
-    new_description = input()
+    new_name = read_line(_NEW_PROJECT_NAME_PROMPT)
+    new_description = read_line(_NEW_PROJECT_DESCRIPTION_PROMPT)
     return new_name, new_description
 
 
 def display_edit_task_menu():
-    print("Enter new task name:")
-    new_name = input()
-    print("Enter new task description:")
-    new_description = input()
-    print("Enter new task status:")
-    new_status = input()
-    print("Enter new task deadline:")
-    new_deadline = input()
+    new_name = read_line(_NEW_TASK_NAME_PROMPT)
+    new_description = read_line(_NEW_TASK_DESCRIPTION_PROMPT)
+    new_status = read_line(_NEW_TASK_STATUS_PROMPT)
+    new_deadline = read_line(_NEW_TASK_DEADLINE_PROMPT)
     return new_name, new_description, new_status, new_deadline
 
 
 def display_edit_task_status_menu():
-    print("Enter new task status:")
-    new_status = input()
+    new_status = read_line(_NEW_TASK_STATUS_PROMPT)
     return new_status
 
 
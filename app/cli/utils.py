@@ -1,4 +1,7 @@
 """Utility functions for CLI error handling and display."""
+import asyncio
+import sys
+import threading
 from typing import Optional, TypeVar, Callable, Any
 
 from app.core.exceptions import (
@@ -15,6 +18,90 @@ from app.core.exceptions import (
 
 T = TypeVar("T")
 
+# Message prefix per exception class; subclasses resolve through their MRO,
+# so the most specific entry wins (e.g. ProjectLimitError before ProjectError)
+_ERROR_PREFIXES = {
+    ValidationError: "Validation error",
+    ProjectLimitError: "Project limit reached",
+    TaskLimitError: "Task limit reached",
+    ProjectNotFoundError: "Project not found",
+    TaskNotFoundError: "Task not found",
+    ProjectError: "Project error",
+    TaskError: "Task error",
+    TodoError: "Application error",
+    ValueError: "Invalid input",
+}
+
+# Prompts are only worth writing when a person is typing the input
+INTERACTIVE = sys.stdin.isatty()
+
+# Accepted answers for confirm_action, after strip().lower()
+_YES = frozenset({"y", "yes"})
+_NO = frozenset({"n", "no"})
+
+
+def read_line(prompt: str = "") -> str:
+    """Read a line from stdin, writing `prompt` first when given.
+
+    Drop-in replacement for the builtin `input()` that skips its extra
+    stderr flush and empty stdout writes on every call. The prompt is
+    omitted when stdin is not a terminal (piped or scripted input).
+
+    Args:
+        prompt: Text written to stdout before reading
+
+    Returns:
+        The line read, without its trailing newline
+
+    Raises:
+        EOFError: If stdin is exhausted
+    """
+    if prompt and INTERACTIVE:
+        sys.stdout.write(prompt)
+    # stdout is block-buffered while the CLI runs; flush pending output here
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
+
+
+async def run_blocking(func: Callable[..., T], *args: Any) -> T:
+    """Run a blocking call on a daemon thread and await its result.
+
+    Keeps stdin reads (and the DB work around them) off the event loop. A
+    daemon thread is used rather than the loop's default executor so that a
+    read still blocked on stdin does not hold up interpreter exit.
+
+    Args:
+        func: The blocking function to call
+        *args: Positional arguments for the function
+
+    Returns:
+        The function result
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def _settle(result: Any, error: Optional[BaseException]) -> None:
+        if future.cancelled():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def _run() -> None:
+        try:
+            result = func(*args)
+        except BaseException as e:  # noqa: BLE001 - re-raised in the awaiting task
+            loop.call_soon_threadsafe(_settle, None, e)
+        else:
+            loop.call_soon_threadsafe(_settle, result, None)
+
+    threading.Thread(target=_run, daemon=True).start()
+    return await future
+
 
 def handle_application_error(func: Callable[..., T], *args: Any, **kwargs: Any) -> Optional[T]:
     """Execute a function and handle any application errors gracefully.
@@ -34,26 +121,14 @@ def handle_application_error(func: Callable[..., T], *args: Any, **kwargs: Any)
     """
     try:
         return func(*args, **kwargs)
-    except ValidationError as e:
-        print(f"Validation error: {str(e)}")
-    except ProjectLimitError as e:
-        print(f"Project limit reached: {str(e)}")
-    except TaskLimitError as e:
-        print(f"Task limit reached: {str(e)}")
-    except ProjectNotFoundError as e:
-        print(f"Project not found: {str(e)}")
-    except TaskNotFoundError as e:
-        print(f"Task not found: {str(e)}")
-    except ProjectError as e:
-        print(f"Project error: {str(e)}")
-    except TaskError as e:
-        print(f"Task error: {str(e)}")
-    except TodoError as e:
-        print(f"Application error: {str(e)}")
-    except ValueError as e:
-        print(f"Invalid input: {str(e)}")
     except Exception as e:
-        print(f"Unexpected error: {str(e)}")
+        prefix = "Unexpected error"
+        for cls in type(e).__mro__:
+            mapped = _ERROR_PREFIXES.get(cls)
+            if mapped is not None:
+                prefix = mapped
+                break
+        print(f"{prefix}: {e}")
     return None
 
 
@@ -76,9 +151,9 @@ def confirm_action(prompt: str) -> bool:
         True if user confirms, False otherwise
     """
     while True:
-        response = input(f"{prompt} (y/n): ").strip().lower()
-        if response in ("y", "yes"):
+        response = read_line(f"{prompt} (y/n): ").strip().lower()
+        if response in _YES:
             return True
-        if response in ("n", "no"):
+        if response in _NO:
             return False
         print("Please answer 'y' or 'n'.")
\ No newline at end of file
@@ -7,10 +7,10 @@ This command will mark tasks whose deadline is before today and are not
 already marked as `done`, set their `closed_at` timestamp, and
 persist the changes.
 """
+import asyncio
 from datetime import datetime, timezone
-from typing import List
 
-from app.db.session import get_db
+from app.db.session import session_scope
 from app.repositories import TaskRepository
 from app.exceptions import DatabaseOperationError
 
@@ -19,64 +19,37 @@ def autoclose_overdue_tasks() -> None:
     """Close overdue tasks by setting status to 'done' and recording closed_at.
 
     Behavior:
-    - Obtains a DB session via `get_db()`.
-    - Uses `TaskRepository.get_overdue_tasks()` to find overdue tasks.
-    - Marks each task as done, sets `closed_at` to now (UTC), and commits.
+    - Runs in one unit of work via `session_scope()`, which commits on success.
+    - Uses `TaskRepository.close_overdue()` to close every overdue task in a
+      single UPDATE, with `closed_at` set to now (UTC).
     - Prints a summary of actions taken.
     """
-    db = next(get_db())
-    closed_count = 0
     try:
-        repo = TaskRepository(db)
-
-        try:
-            overdue: List = repo.get_overdue_tasks()
-        except Exception as e:
-            print(f"Error fetching overdue tasks: {e}")
-            return
-
-        if not overdue:
-            print("No overdue tasks found")
-            return
+        with session_scope() as db:
+            closed = TaskRepository(db).close_overdue(datetime.now(timezone.utc))
+    except DatabaseOperationError as db_err:
+        print(f"Database error closing overdue tasks: {db_err}")
+        return
+    except Exception as e:
+        print(f"Unexpected error in autoclose_overdue_tasks: {e}")
+        return
 
-        for task in overdue:
-            try:
-                # Update in-memory ORM object
-                task.status = "done"
-                task.closed_at = datetime.now(timezone.utc)
+    if not closed:
+        print("No overdue tasks found")
+        return
 
-                # Persist changes
-                db.add(task)
-                db.commit()
-                db.refresh(task)
+    for task_name, project_name in closed:
+        print(f"Closed task: {task_name} (Project: {project_name})")
+    print(f"Closed {len(closed)} overdue tasks")
 
-                proj_name = getattr(task, "project", None)
-                proj_display = proj_name.name if proj_name and getattr(proj_name, "name", None) else str(task.project_id)
-                print(f"Closed task: {task.name} (Project: {proj_display})")
-                closed_count += 1
-            except DatabaseOperationError as db_err:
-                # Repository-level DB errors
-                print(f"Database error closing task id={getattr(task, 'id', '<unknown>')}: {db_err}")
-                try:
-                    db.rollback()
-                except Exception:
-                    pass
-            except Exception as err:
-                print(f"Unexpected error closing task id={getattr(task, 'id', '<unknown>')}: {err}")
-                try:
-                    db.rollback()
-                except Exception:
-                    pass
 
-        print(f"Closed {closed_count} overdue tasks")
+async def autoclose_overdue_tasks_async() -> None:
+    """Awaitable `autoclose_overdue_tasks` for use inside an event loop.
 
-    except Exception as e:
-        print(f"Unexpected error in autoclose_overdue_tasks: {e}")
-    finally:
-        try:
-            db.close()
-        except Exception:
-            pass
+    The synchronous DB work runs on a worker thread so the loop keeps serving
+    other coroutines (e.g. the scheduler or a FastAPI startup hook).
+    """
+    await asyncio.to_thread(autoclose_overdue_tasks)
 
 
 if __name__ == "__main__":
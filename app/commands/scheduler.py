@@ -1,18 +1,18 @@
 """Simple scheduler to run maintenance commands periodically.
 
-Uses the `schedule` library to run `autoclose_overdue_tasks` every minute.
+Runs `autoclose_overdue_tasks_async` every minute on an asyncio event loop. Ticks
+are aligned to a fixed interval on the loop's monotonic clock, so time
+spent in a job does not push later runs back.
 
 Run with:
     python -m app.commands.scheduler
-
-Note: install `schedule` in your environment: `poetry add schedule` or
-`pip install schedule`.
 """
-import time
-import schedule
+import asyncio
 from datetime import datetime, timezone
 
-from app.commands.autoclose_overdue import autoclose_overdue_tasks
+from app.commands.autoclose_overdue import autoclose_overdue_tasks_async
+
+_INTERVAL_SECONDS = 60.0
 
 
 def _log(msg: str) -> None:
@@ -20,26 +20,32 @@ def _log(msg: str) -> None:
     print(f"[{now}] {msg}")
 
 
+async def _run_periodically(job, interval: float) -> None:
+    """Await `job()` every `interval` seconds, starting one interval from now."""
+    loop = asyncio.get_running_loop()
+    next_run = loop.time() + interval
+    while True:
+        await asyncio.sleep(max(0.0, next_run - loop.time()))
+        await _run_job(job)
+        # Skip ticks missed while a slow job ran instead of firing them back to back
+        next_run = max(next_run + interval, loop.time())
+
+
 def main() -> None:
     _log("Starting task scheduler...")
     _log("Auto-close overdue tasks will run every 1 minute.")
 
-    # Schedule the task every 1 minute
-    schedule.every(1).minutes.do(lambda: _run_job(autoclose_overdue_tasks))
-
     try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        asyncio.run(_run_periodically(autoclose_overdue_tasks_async, _INTERVAL_SECONDS))
     except KeyboardInterrupt:
         _log("Scheduler stopped by user")
 
 
-def _run_job(job_callable) -> None:
-    """Run a job callable and log start/end and exceptions."""
-    _log(f"Running scheduled job: {getattr(job_callable, '__name__', str(job_callable))}")
+async def _run_job(job) -> None:
+    """Await a job coroutine function and log start/end and exceptions."""
+    _log(f"Running scheduled job: {getattr(job, '__name__', str(job))}")
     try:
-        job_callable()
+        await job()
         _log("Job completed successfully")
     except Exception as e:
         _log(f"Job raised an exception: {e}")
@@ -1,7 +1,5 @@
 """Configuration module for the todo application."""
 from .settings import (
-    MAX_NUMBER_OF_PROJECT,
-    MAX_NUMBER_OF_TASK,
+    max_projects,
+    max_tasks,
 )
-
-
@@ -1,46 +1,99 @@
 """Configuration settings for the todo application."""
 import os
+from functools import cache
+from pathlib import Path
 from typing import Optional
 
-try:
-    from dotenv import load_dotenv  # type: ignore
-    load_dotenv()
-except Exception:
-    pass
 
+def _find_dotenv_file() -> Optional[Path]:
+    """Return the .env file to load, or None when there is nothing to load.
 
-def _get_positive_int_env(var_name: str, default_value: int) -> int:
-    """Get a positive integer from environment variable.
+    Looks in the working directory, then at the project root. Setting
+    SKIP_DOTENV (e.g. in containers whose environment is already populated)
+    disables .env loading entirely.
+    """
+    if os.environ.get("SKIP_DOTENV"):
+        return None
+    for candidate in (Path.cwd() / ".env", Path(__file__).resolve().parents[2] / ".env"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+# python-dotenv is only imported when there is a .env file to read
+_dotenv_file = _find_dotenv_file()
+if _dotenv_file is not None:
+    try:
+        from dotenv import load_dotenv  # type: ignore
+        load_dotenv(_dotenv_file)
+    except Exception:
+        pass
+
+# Prefixes of every variable this module reads
+_ENV_PREFIXES = ("MAX_NUMBER_OF_", "DATABASE_URL", "DB_", "STRICT_LOADING")
+
+# Scan the environment once, after .env has been merged into it, keeping only
+# our own variables; every setting below is read from this small plain dict
+_ENV = {key: value for key, value in os.environ.items() if key.startswith(_ENV_PREFIXES)}
+
+
+def _get_int_env(var_name: str, default_value: int, minimum: int) -> int:
+    """Get an integer of at least `minimum` from an environment variable.
     
     Args:
         var_name: Name of the environment variable
         default_value: Default value if var not found or invalid
+        minimum: Smallest accepted value
         
     Returns:
-        The positive integer value or default_value
+        The integer value or default_value
     """
-    raw_value = os.getenv(var_name)
+    raw_value = _ENV.get(var_name)
     if raw_value is None:
         return default_value
     try:
         parsed = int(raw_value)
-        if parsed < 1:
+        if parsed < minimum:
             return default_value
         return parsed
     except ValueError:
         return default_value
 
 
-# Maximum number of projects allowed in the application
-MAX_NUMBER_OF_PROJECT: int = _get_positive_int_env("MAX_NUMBER_OF_PROJECT", 10)
+def _get_positive_int_env(var_name: str, default_value: int) -> int:
+    """Get a positive integer from environment variable.
+    
+    Args:
+        var_name: Name of the environment variable
+        default_value: Default value if var not found or invalid
+        
+    Returns:
+        The positive integer value or default_value
+    """
+    return _get_int_env(var_name, default_value, 1)
+
 
-# Maximum number of tasks allowed per project
-MAX_NUMBER_OF_TASK: int = _get_positive_int_env("MAX_NUMBER_OF_TASK", 50)
+@cache
+def max_projects() -> int:
+    """Maximum number of projects allowed in the application.
+
+    Parsed from MAX_NUMBER_OF_PROJECT (default 10) on first call, then memoized.
+    """
+    return _get_positive_int_env("MAX_NUMBER_OF_PROJECT", 10)
+
+
+@cache
+def max_tasks() -> int:
+    """Maximum number of tasks allowed per project.
+
+    Parsed from MAX_NUMBER_OF_TASK (default 50) on first call, then memoized.
+    """
+    return _get_positive_int_env("MAX_NUMBER_OF_TASK", 50)
 
 
 def _get_required_env(var_name: str) -> str:
     """Retrieve required environment variable or raise a clear error."""
-    value = os.getenv(var_name)
+    value = _ENV.get(var_name)
     if value is None or value.strip() == "":
         raise RuntimeError(f"Missing required environment variable: {var_name}")
     return value
@@ -48,10 +101,19 @@ def _get_required_env(var_name: str) -> str:
 
 # Database configuration
 DATABASE_URL: str = _get_required_env("DATABASE_URL")
-DB_HOST: Optional[str] = os.getenv("DB_HOST")
-DB_PORT: Optional[str] = os.getenv("DB_PORT")
-DB_NAME: Optional[str] = os.getenv("DB_NAME")
-DB_USER: Optional[str] = os.getenv("DB_USER")
-DB_PASSWORD: Optional[str] = os.getenv("DB_PASSWORD")
+DB_HOST: Optional[str] = _ENV.get("DB_HOST")
+DB_PORT: Optional[str] = _ENV.get("DB_PORT")
+DB_NAME: Optional[str] = _ENV.get("DB_NAME")
+DB_USER: Optional[str] = _ENV.get("DB_USER")
+DB_PASSWORD: Optional[str] = _ENV.get("DB_PASSWORD")
+
+# Connection pool for the API engine (ignored for SQLite URLs)
+DB_POOL_SIZE: int = _get_positive_int_env("DB_POOL_SIZE", 25)
+DB_MAX_OVERFLOW: int = _get_int_env("DB_MAX_OVERFLOW", 10, 0)
+DB_POOL_TIMEOUT: int = _get_positive_int_env("DB_POOL_TIMEOUT", 30)
+DB_POOL_RECYCLE: int = _get_positive_int_env("DB_POOL_RECYCLE", 1800)
 
 
+# Development aid: when STRICT_LOADING=1, repository queries make any
+# relationship lazy load raise instead of silently issuing a SELECT
+STRICT_LOADING: bool = _ENV.get("STRICT_LOADING") == "1"
@@ -1,3 +1,19 @@
-from app.models import Project, Task
+"""Core helpers for the todo application.
 
+`Project` and `Task` are still importable from here, but are resolved on
+first access (PEP 562) so that importing `app.core.exceptions`,
+`app.core.dates` or `app.core.validation` does not pull in SQLAlchemy and
+the ORM models.
+"""
 
+__all__ = ["Project", "Task"]
+
+
+def __getattr__(name: str):
+    if name in __all__:
+        import app.models
+
+        value = getattr(app.models, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,25 @@
+"""Per-request date helpers for the todo application."""
+from contextvars import ContextVar
+from datetime import date
+
+_today: ContextVar[date] = ContextVar("today")
+
+
+def pin_today() -> None:
+    """Fix "today" for the current context (one HTTP request).
+
+    Deadline validators called while handling the request then share a single
+    clock read instead of calling `date.today()` each time.
+    """
+    _today.set(date.today())
+
+
+def today() -> date:
+    """Return the date pinned for the current context, or the live date.
+
+    Callers outside an HTTP request (CLI, scheduled jobs) get `date.today()`.
+    """
+    try:
+        return _today.get()
+    except LookupError:
+        return date.today()
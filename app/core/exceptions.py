@@ -3,46 +3,13 @@
 DEPRECATED: This module is maintained for backwards compatibility.
 New code should import from app.exceptions instead.
 
-This module re-exports all exceptions from app.exceptions to maintain
-backwards compatibility with existing code that imports from app.core.exceptions.
+On import, this module replaces itself in sys.modules with app.exceptions,
+so `app.core.exceptions` and `app.exceptions` are the same module object and
+every exception class is shared rather than re-bound here.
 """
 
-# Import all exceptions from the new location
-from app.exceptions import (
-    # Base exceptions
-    TodoError,
-    # Repository exceptions
-    RepositoryError,
-    DatabaseConnectionError,
-    DatabaseOperationError,
-    RecordNotFoundError,
-    # Service exceptions
-    ValidationError,
-    ProjectError,
-    ProjectNotFoundError,
-    DuplicateProjectError,
-    ProjectLimitError,
-    TaskError,
-    TaskNotFoundError,
-    DuplicateTaskError,
-    TaskLimitError,
-)
+import sys
 
-# Re-export for backwards compatibility
-__all__ = [
-    "TodoError",
-    "ValidationError",
-    "ProjectError",
-    "ProjectNotFoundError",
-    "DuplicateProjectError",
-    "ProjectLimitError",
-    "TaskError",
-    "TaskNotFoundError",
-    "DuplicateTaskError",
-    "TaskLimitError",
-    # New repository exceptions (also available for backwards compatibility)
-    "RepositoryError",
-    "DatabaseConnectionError",
-    "DatabaseOperationError",
-    "RecordNotFoundError",
-]
+from app import exceptions as _exceptions
+
+sys.modules[__name__] = _exceptions
@@ -3,10 +3,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import date
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Task:
     """Represents a task within a project."""
     name: str
@@ -38,13 +38,36 @@ class Task:
         self.status = new_status
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """Represents a project containing tasks."""
     name: str
     description: str
     tasks: List[Task] = field(default_factory=list)
 
+    @classmethod
+    def bulk_from_rows(cls, rows: Iterable[Any]) -> List[Project]:
+        """Build task-less projects from rows with `name` and `description`.
+        
+        Skips the generated `__init__` (and its `default_factory` call) per
+        object, for hydrating many projects at once.
+        
+        Args:
+            rows: Objects or result rows exposing `name` and `description`
+            
+        Returns:
+            One project per row, in order, each with an empty task list
+        """
+        new = cls.__new__
+        projects = []
+        for row in rows:
+            project = new(cls)
+            project.name = row.name
+            project.description = row.description
+            project.tasks = []
+            projects.append(project)
+        return projects
+
     def edit_project(self, new_name: str, new_description: str) -> None:
         """Update project details.
         
@@ -76,7 +99,14 @@ class Project:
         
         Args:
             task: The task to remove
+            
+        Raises:
+            ValueError: If the task is not in this project
         """
-        self.tasks.remove(task)
+        for index, existing in enumerate(self.tasks):
+            if existing is task:
+                del self.tasks[index]
+                return
+        raise ValueError("Task is not in this project.")
 
 
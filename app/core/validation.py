@@ -1,9 +1,29 @@
 """Validation utilities for the todo application."""
-from datetime import datetime, date
-from typing import List, Optional
+import sys
+from datetime import date
+from typing import Collection, Optional
 
+from app.core.dates import today
 from app.core.exceptions import ValidationError, DuplicateProjectError, DuplicateTaskError
-from app.models import Project, Task
+
+# Canonical status strings, interned so every validated status shares one object
+STATUS_TODO = sys.intern("todo")
+STATUS_DOING = sys.intern("doing")
+STATUS_DONE = sys.intern("done")
+
+# Stripped, lower-cased status -> canonical status; blank means the default
+_STATUS_MAP = {
+    STATUS_TODO: STATUS_TODO,
+    STATUS_DOING: STATUS_DOING,
+    STATUS_DONE: STATUS_DONE,
+    "": STATUS_TODO,
+}
+
+
+def _exceeds_word_limit(text: str, limit: int) -> bool:
+    # Splitting stops after `limit` words, so long inputs are never fully
+    # tokenized; a (limit + 1)th element means the limit was exceeded
+    return len(text.split(maxsplit=limit)) > limit
 
 
 def validate_project_name(name: str) -> None:
@@ -15,11 +35,11 @@ def validate_project_name(name: str) -> None:
     Raises:
         ValidationError: If name is invalid
     """
-    if not name or str(name).strip() == "":
+    text = str(name).strip() if name else ""
+    if not text:
         raise ValidationError("Project name is required.")
     
-    name_word_count = len(str(name).strip().split())
-    if name_word_count > 30:
+    if _exceeds_word_limit(text, 30):
         raise ValidationError("Project name must be <= 30 words.")
 
 
@@ -32,22 +52,22 @@ def validate_project_description(description: str) -> None:
     Raises:
         ValidationError: If description is invalid
     """
-    desc_word_count = len(str(description).strip().split())
-    if desc_word_count > 150:
+    if _exceeds_word_limit(str(description), 150):
         raise ValidationError("Project description must be <= 150 words.")
 
 
-def validate_unique_project_name(name: str, existing_projects: List[Project]) -> None:
+def validate_unique_project_name(name: str, existing_names: Collection[str]) -> None:
     """Ensure project name is unique.
     
     Args:
         name: The project name to check
-        existing_projects: List of existing projects
+        existing_names: Names of existing projects; pass a set (built once
+            by the caller) for an O(1) membership check
         
     Raises:
         DuplicateProjectError: If name already exists
     """
-    if any(p.name == name for p in existing_projects):
+    if name in existing_names:
         raise DuplicateProjectError("Project name must be unique.")
 
 
@@ -60,11 +80,11 @@ def validate_task_name(name: str) -> None:
     Raises:
         ValidationError: If name is invalid
     """
-    if not name or str(name).strip() == "":
+    text = str(name).strip() if name else ""
+    if not text:
         raise ValidationError("Task name is required.")
     
-    name_word_count = len(str(name).strip().split())
-    if name_word_count > 30:
+    if _exceeds_word_limit(text, 30):
         raise ValidationError("Task name must be <= 30 words.")
 
 
@@ -77,8 +97,7 @@ def validate_task_description(description: str) -> None:
     Raises:
         ValidationError: If description is invalid
     """
-    desc_word_count = len(str(description).strip().split())
-    if desc_word_count > 150:
+    if _exceeds_word_limit(str(description), 150):
         raise ValidationError("Task description must be <= 150 words.")
 
 
@@ -94,43 +113,53 @@ def validate_task_status(status: str) -> str:
     Raises:
         ValidationError: If status is invalid
     """
-    allowed_status = {"todo", "doing", "done"}
-    if status is None or str(status).strip() == "":
-        return "todo"
+    if status is None:
+        return STATUS_TODO
     
-    normalized = str(status).strip().lower()
-    if normalized not in allowed_status:
+    try:
+        return _STATUS_MAP[str(status).strip().lower()]
+    except KeyError:
         raise ValidationError("Task status must be one of: todo, doing, done.")
-    return normalized
 
 
-def validate_task_deadline(deadline: Optional[str]) -> None:
+def validate_task_deadline(deadline: Optional[str]) -> Optional[date]:
     """Validate a task deadline.
     
     Args:
         deadline: The deadline to validate (YYYY-MM-DD) or None
         
+    Returns:
+        The parsed deadline, or None if no deadline was given
+        
     Raises:
         ValidationError: If deadline is invalid
     """
-    if deadline is not None and str(deadline).strip():
-        try:
-            parsed = datetime.strptime(str(deadline).strip(), "%Y-%m-%d").date()
-        except ValueError:
-            raise ValidationError("Task deadline must be in YYYY-MM-DD format.")
-        if parsed < date.today():
-            raise ValidationError("Task deadline cannot be in the past.")
-
-
-def validate_unique_task_name(name: str, existing_tasks: List[Task]) -> None:
+    text = str(deadline).strip() if deadline is not None else ""
+    if not text:
+        return None
+    # fromisoformat also accepts compact and week dates (20260102, 2026-W01-5),
+    # so pin the shape to YYYY-MM-DD before handing it over
+    if len(text) != 10 or text[4] != "-" or text[7] != "-":
+        raise ValidationError("Task deadline must be in YYYY-MM-DD format.")
+    try:
+        parsed = date.fromisoformat(text)
+    except ValueError:
+        raise ValidationError("Task deadline must be in YYYY-MM-DD format.")
+    if parsed < today():
+        raise ValidationError("Task deadline cannot be in the past.")
+    return parsed
+
+
+def validate_unique_task_name(name: str, existing_names: Collection[str]) -> None:
     """Ensure task name is unique within its project.
     
     Args:
         name: The task name to check
-        existing_tasks: List of existing tasks in the project
+        existing_names: Names of existing tasks in the project; pass a set
+            (built once by the caller) for an O(1) membership check
         
     Raises:
         DuplicateTaskError: If name already exists in project
     """
-    if any(t.name == name for t in existing_tasks):
+    if name in existing_names:
         raise DuplicateTaskError("Task name must be unique within its project.")
\ No newline at end of file
@@ -1,7 +1,7 @@
 """Database package exports."""
 
 from app.db.base import Base
-from app.db.session import SessionLocal, engine, get_db
+from app.db.session import SessionLocal, engine, get_db, session_scope
 
-__all__ = ["Base", "engine", "SessionLocal", "get_db"]
+__all__ = ["Base", "engine", "SessionLocal", "get_db", "session_scope"]
 
@@ -1,8 +1,19 @@
 """Base declarative class for SQLAlchemy ORM models."""
 
+from datetime import datetime, timezone
+
 from sqlalchemy.orm import DeclarativeBase
 
 
+def utcnow() -> datetime:
+    """Return the current time as an aware UTC datetime.
+
+    Used as the client-side default for timestamp columns, so the values are
+    known to the session right after INSERT/UPDATE without re-selecting them.
+    """
+    return datetime.now(timezone.utc)
+
+
 class Base(DeclarativeBase):
     """Declarative base for all ORM models."""
 
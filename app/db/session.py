@@ -1,14 +1,62 @@
 """Database session and engine configuration."""
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, make_url
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from app.config import settings
+from app.exceptions import DatabaseOperationError
 
-engine = create_engine(settings.DATABASE_URL)
+_url = make_url(settings.DATABASE_URL)
 
+if _url.get_backend_name() == "sqlite":
+    # Local SQLite: connections may be used from FastAPI's threadpool. Only an
+    # in-memory database shares a single connection (StaticPool), since each
+    # new connection would otherwise see its own empty database; file
+    # databases keep SQLAlchemy's default pool so every session gets its own
+    # connection and transaction. QueuePool sizing settings do not apply.
+    _in_memory = _url.database in (None, "", ":memory:") or _url.query.get("mode") == "memory"
+    if _in_memory:
+        engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(
+            settings.DATABASE_URL,
+            connect_args={"check_same_thread": False},
+        )
+
+    @event.listens_for(engine, "connect")
+    def _enable_sqlite_foreign_keys(dbapi_connection, connection_record) -> None:  # noqa: ARG001
+        # SQLite leaves FK enforcement off by default; project deletes rely on
+        # ON DELETE CASCADE to remove their tasks
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+else:
+    # Request handlers share a QueuePool of warm connections: pre-ping drops
+    # connections the server closed, and recycle retires them before typical
+    # idle timeouts. Sizes come from DB_POOL_* settings so they can be tuned
+    # per deployment under load. Alembic keeps NullPool since migrations run
+    # one-shot.
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+    )
+
+# expire_on_commit=False: objects stay readable after the unit of work
+# commits, without a re-SELECT. The flip side is that those objects keep the
+# values this session last saw; call session.refresh(obj) where a read must
+# reflect changes made by other sessions since.
 SessionLocal = sessionmaker(
     bind=engine,
     autoflush=False,
@@ -17,11 +65,63 @@ SessionLocal = sessionmaker(
 )
 
 
-def get_db() -> Generator[Session, None, None]:
-    """Yield a database session and ensure it is properly closed."""
+# Callbacks queued by run_after_commit, kept in Session.info
+_AFTER_COMMIT_KEY = "after_commit_callbacks"
+
+
+def run_after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """Run `callback` once the session's current transaction has committed.
+
+    Callbacks are dropped if the transaction rolls back instead, so they only
+    ever observe changes that are actually persisted.
+    """
+    db.info.setdefault(_AFTER_COMMIT_KEY, []).append(callback)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _run_after_commit_callbacks(session: Session) -> None:
+    for callback in session.info.pop(_AFTER_COMMIT_KEY, ()):
+        callback()
+
+
+@event.listens_for(SessionLocal, "after_rollback")
+def _drop_after_commit_callbacks(session: Session) -> None:
+    session.info.pop(_AFTER_COMMIT_KEY, None)
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Provide a session as one unit of work.
+
+    Repositories only flush their writes; the transaction is committed once
+    here when the block exits normally, and rolled back if it raises.
+
+    Raises:
+        DatabaseOperationError: If the final commit fails
+    """
     db = SessionLocal()
     try:
         yield db
+    except BaseException:
+        db.rollback()
+        raise
+    else:
+        try:
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            raise DatabaseOperationError(f"Failed to commit transaction: {e}") from e
     finally:
         db.close()
 
+
+def get_db() -> Generator[Session, None, None]:
+    """Yield a session for one request, committed when the endpoint returns.
+
+    Declare it with `Depends(get_db, scope="function")` so the commit runs
+    before the response is sent and a failed commit reaches the exception
+    handlers; with the default request scope it would run after the client
+    already has its response.
+    """
+    with session_scope() as db:
+        yield db
@@ -4,10 +4,12 @@ from __future__ import annotations
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.api import api_router
 from app.api.controller_schemas.responses.users_response_schema import ErrorResponse
+from app.core.dates import pin_today
 from app.db.session import engine
 from app.exceptions import (
     DatabaseOperationError,
@@ -17,6 +19,7 @@ from app.exceptions import (
     ProjectNotFoundError,
     TaskLimitError,
     TaskNotFoundError,
+    TodoError,
     ValidationError,
 )
 
@@ -26,6 +29,7 @@ app = FastAPI(
     description="RESTful API for ToDoList project management",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
 )
 
 # Development CORS (allow all)
@@ -38,60 +42,66 @@ app.add_middleware(
 )
 
 
-@app.on_event("startup")
-async def on_startup() -> None:
-    # Eagerly verify DB connectivity on startup
-    conn = None
-    try:
-        conn = engine.connect()
-    finally:
-        if conn is not None:
-            conn.close()
+class PinRequestDateMiddleware:
+    """Read the clock once per request; deadline validators reuse the value."""
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-@app.on_event("shutdown")
-async def on_shutdown() -> None:
-    # Dispose engine connections
-    engine.dispose()
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            pin_today()
+        await self.app(scope, receive, send)
 
 
-@app.exception_handler(ValidationError)
-async def handle_validation_error(request: Request, exc: ValidationError) -> JSONResponse:  # noqa: ARG001
-    payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=400, content=payload.model_dump())
+app.add_middleware(PinRequestDateMiddleware)
 
 
-@app.exception_handler(ProjectNotFoundError)
-@app.exception_handler(TaskNotFoundError)
-async def handle_not_found(request: Request, exc: Exception) -> JSONResponse:  # noqa: ARG001
-    payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=404, content=payload.model_dump())
+@app.on_event("shutdown")
+async def on_shutdown() -> None:
+    # Dispose engine connections
+    engine.dispose()
 
 
-@app.exception_handler(DuplicateProjectError)
-@app.exception_handler(DuplicateTaskError)
-async def handle_conflict(request: Request, exc: Exception) -> JSONResponse:  # noqa: ARG001
-    payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=409, content=payload.model_dump())
+# HTTP status per application error; subclasses resolve through their MRO,
+# and any other TodoError maps to 500
+_ERROR_STATUS_CODES = {
+    ValidationError: 400,
+    ProjectLimitError: 400,
+    TaskLimitError: 400,
+    ProjectNotFoundError: 404,
+    TaskNotFoundError: 404,
+    DuplicateProjectError: 409,
+    DuplicateTaskError: 409,
+    DatabaseOperationError: 500,
+}
 
 
-@app.exception_handler(ProjectLimitError)
-@app.exception_handler(TaskLimitError)
-async def handle_limit(request: Request, exc: Exception) -> JSONResponse:  # noqa: ARG001
+def _error_response(status_code: int, exc: Exception) -> Response:
+    # Serialize straight to JSON bytes in pydantic-core rather than dumping
+    # to a dict and encoding that again
     payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=400, content=payload.model_dump())
+    return Response(
+        content=payload.model_dump_json(),
+        status_code=status_code,
+        media_type="application/json",
+    )
 
 
-@app.exception_handler(DatabaseOperationError)
-async def handle_db_error(request: Request, exc: DatabaseOperationError) -> JSONResponse:  # noqa: ARG001
-    payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=500, content=payload.model_dump())
+@app.exception_handler(TodoError)
+async def handle_todo_error(request: Request, exc: TodoError) -> Response:  # noqa: ARG001
+    status_code = 500
+    for cls in type(exc).__mro__:
+        mapped = _ERROR_STATUS_CODES.get(cls)
+        if mapped is not None:
+            status_code = mapped
+            break
+    return _error_response(status_code, exc)
 
 
 @app.exception_handler(Exception)
-async def handle_generic_error(request: Request, exc: Exception) -> JSONResponse:  # noqa: ARG001
-    payload = ErrorResponse(detail=str(exc), error_type=exc.__class__.__name__)
-    return JSONResponse(status_code=500, content=payload.model_dump())
+async def handle_generic_error(request: Request, exc: Exception) -> Response:  # noqa: ARG001
+    return _error_response(500, exc)
 
 
 @app.get("/", summary="API Info")
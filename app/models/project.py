@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING
 from sqlalchemy import DateTime, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 if TYPE_CHECKING:
     from app.models.task import Task
@@ -29,23 +29,31 @@ class Project(Base):
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Timestamps are generated client-side (default/onupdate) so the session
+    # already holds them after a write; server_default still covers rows
+    # inserted outside the application
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow,
         nullable=False
     )
     
-    # Relationship: one-to-many with Task (cascade delete)
+    # Relationship: one-to-many with Task (cascade delete). passive_deletes
+    # leaves removing the tasks to the database's ON DELETE CASCADE, so
+    # deleting a project never loads its tasks just to delete them.
     tasks: Mapped[list["Task"]] = relationship(
         "Task",
         back_populates="project",
         cascade="all, delete-orphan",
+        passive_deletes=True,
         lazy="select"
     )
     
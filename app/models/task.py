@@ -3,10 +3,10 @@
 from datetime import date, datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Date, DateTime, ForeignKey, String, Text, UniqueConstraint, func
+from sqlalchemy import Date, DateTime, ForeignKey, Index, String, Text, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, utcnow
 
 if TYPE_CHECKING:
     from app.models.project import Project
@@ -39,15 +39,20 @@ class Task(Base):
         DateTime(timezone=True),
         nullable=True
     )
+    # Timestamps are generated client-side (default/onupdate) so the session
+    # already holds them after a write; server_default still covers rows
+    # inserted outside the application
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        default=utcnow,
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=utcnow,
         nullable=False
     )
     project_id: Mapped[int] = mapped_column(
@@ -55,16 +60,22 @@ class Task(Base):
         nullable=False
     )
     
-    # Relationship: many-to-one with Project
+    # Relationship: many-to-one with Project. Listings that show the project
+    # eager-load it (joinedload/selectinload); anything else touching
+    # task.project without it already in the session fails loudly instead of
+    # issuing one SELECT per task.
     project: Mapped["Project"] = relationship(
         "Project",
         back_populates="tasks",
-        lazy="select"
+        lazy="raise_on_sql"
     )
     
-    # Unique constraint: task names must be unique within a project
+    # Unique constraint: task names must be unique within a project.
+    # Composite index: per-project task listings filter on project_id and
+    # order by created_at, so both are served from one index scan.
     __table_args__ = (
         UniqueConstraint("project_id", "name", name="uq_task_project_name"),
+        Index("ix_tasks_project_id_created_at", "project_id", "created_at"),
     )
     
     def __repr__(self) -> str:
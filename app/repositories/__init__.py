@@ -4,10 +4,11 @@ This module provides repository classes that implement the Repository Pattern,
 handling all database operations for entities with proper error handling.
 """
 
-from app.repositories.project_repository import ProjectRepository
+from app.repositories.project_repository import ProjectListRow, ProjectRepository
 from app.repositories.task_repository import TaskRepository
 
 __all__ = [
+    "ProjectListRow",
     "ProjectRepository",
     "TaskRepository",
 ]
@@ -1,21 +1,45 @@
 """Repository for Project entity database operations.
 
 This module encapsulates persistence and database error handling for projects.
-Business validation and rules are handled by the service layer.
+Business validation and rules are handled by the service layer. Writes are
+flushed, not committed: the session's owner (`get_db` / `session_scope`)
+commits once per unit of work.
 """
 
-from typing import List, Optional
+from collections import namedtuple
+from typing import Iterable, List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, bindparam, delete, func, insert, lambda_stmt, literal, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload, selectinload
 
+from app.config import settings
 from app.exceptions.repository_exceptions import DatabaseOperationError
 from app.exceptions.service_exceptions import (
     DuplicateProjectError,
     ProjectNotFoundError,
 )
 from app.models.project import Project
+from app.models.task import Task
+from app.repositories.utils import is_unique_violation
+
+# Lightweight row for project listings
+ProjectListRow = namedtuple("ProjectListRow", "id name description created_at")
+
+# Existence probes for a single constant (no columns transferred, no ORM
+# instance built). Built once as lambda statements, so each call skips
+# constructing the expression tree and goes straight to the compiled cache.
+_EXISTS_BY_NAME = lambda_stmt(
+    lambda: select(literal(1)).where(Project.name == bindparam("name")).limit(1)
+)
+_EXISTS_BY_NAME_EXCLUDING = lambda_stmt(
+    lambda: select(literal(1))
+    .where(Project.name == bindparam("name"), Project.id != bindparam("exclude_id"))
+    .limit(1)
+)
+
+# Loader options added to every entity query when STRICT_LOADING is enabled
+_STRICT_LOADING_OPTIONS = (raiseload("*"),) if settings.STRICT_LOADING else ()
 
 
 class ProjectRepository:
@@ -48,19 +72,58 @@ class ProjectRepository:
         
         try:
             self.db.add(project)
-            self.db.commit()
-            self.db.refresh(project)
+            # No refresh: the primary key comes back from the INSERT and the
+            # timestamps are generated client-side
+            self.db.flush()
             return project
         except IntegrityError as e:
             self.db.rollback()
             # Check if it's a unique constraint violation
-            if "unique" in str(e.orig).lower() or "duplicate" in str(e.orig).lower():
+            if is_unique_violation(e):
                 raise DuplicateProjectError(f"Project '{name}' already exists.") from e
             raise DatabaseOperationError(f"Failed to create project: {e}") from e
         except Exception as e:
             self.db.rollback()
             raise DatabaseOperationError(f"Failed to create project: {e}") from e
     
+    def create_many(self, items: Iterable[Tuple[str, str]]) -> List[int]:
+        """Create several projects with one batched INSERT ... RETURNING.
+        
+        All rows are inserted in a single transaction: either every project
+        is created or, on any error, none is.
+        
+        Args:
+            items: (name, description) pairs, one per project
+            
+        Returns:
+            The new project IDs, in the same order as `items`
+            
+        Raises:
+            DuplicateProjectError: If any name is already taken (or repeated)
+            DatabaseOperationError: If database operation fails
+        """
+        params = [{"name": name, "description": description} for name, description in items]
+        if not params:
+            return []
+        
+        try:
+            ids = list(
+                self.db.scalars(
+                    insert(Project).returning(Project.id, sort_by_parameter_order=True),
+                    params,
+                )
+            )
+            self.db.flush()
+            return ids
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_unique_violation(e):
+                raise DuplicateProjectError("One or more projects already exist.") from e
+            raise DatabaseOperationError(f"Failed to create projects: {e}") from e
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseOperationError(f"Failed to create projects: {e}") from e
+    
     def get_by_id(self, project_id: int) -> Optional[Project]:
         """Fetch project by ID.
         
@@ -71,14 +134,62 @@ class ProjectRepository:
             Project instance if found, None otherwise
         """
         try:
-            stmt = select(Project).where(Project.id == project_id)
-            return self.db.scalar(stmt)
+            # Session.get checks the identity map first and only emits a
+            # primary-key SELECT when the project is not already loaded
+            return self.db.get(Project, project_id, options=_STRICT_LOADING_OPTIONS)
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch project by ID: {e}") from e
+    
+    def get_by_id_with_tasks(self, project_id: int, strict: bool = False) -> Optional[Project]:
+        """Fetch a project by ID with its tasks loaded up front.
+        
+        Tasks are fetched by one extra SELECT (selectinload), so reading
+        `project.tasks` afterwards issues no further queries.
+        
+        Args:
+            project_id: The ID of the project to fetch
+            strict: If True, any other relationship access raises instead of
+                lazy loading (raiseload), to catch accidental N+1 queries;
+                always on when STRICT_LOADING is enabled
+            
+        Returns:
+            Project instance if found, None otherwise
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        try:
+            stmt = select(Project).where(Project.id == project_id).options(selectinload(Project.tasks))
+            if strict or settings.STRICT_LOADING:
+                stmt = stmt.options(raiseload("*"))
+            return self.db.scalars(stmt).one_or_none()
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch project by ID: {e}") from e
     
-    def get_all(self) -> List[Project]:
+    def get_all(self) -> List[ProjectListRow]:
         """Return all projects ordered by creation date (newest first).
         
+        Only the listed columns are selected and returned as plain named
+        tuples, so no ORM instances are built or tracked by the session.
+        Use `get_all_full` when the projects are going to be modified.
+        
+        Returns:
+            List of ProjectListRow tuples, ordered by created_at descending
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        try:
+            stmt = select(
+                Project.id, Project.name, Project.description, Project.created_at
+            ).order_by(Project.created_at.desc())
+            return [ProjectListRow(*row) for row in self.db.execute(stmt)]
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch all projects: {e}") from e
+    
+    def get_all_full(self) -> List[Project]:
+        """Return all projects as ORM instances, newest first.
+        
         Returns:
             List of all Project instances, ordered by created_at descending
             
@@ -86,14 +197,100 @@ class ProjectRepository:
             DatabaseOperationError: If database operation fails
         """
         try:
-            stmt = select(Project).order_by(Project.created_at.desc())
+            stmt = (
+                select(Project)
+                .options(*_STRICT_LOADING_OPTIONS)
+                .order_by(Project.created_at.desc())
+            )
             result = self.db.scalars(stmt)
             return list(result.all())
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch all projects: {e}") from e
     
+    def get_all_with_tasks(self, strict: bool = False) -> List[Project]:
+        """Return all projects with their tasks, newest first.
+        
+        Tasks for every project are fetched by one batched IN query
+        (selectinload) rather than one lazy load per project.
+        
+        Args:
+            strict: If True, any other relationship access raises instead of
+                lazy loading (raiseload), to catch accidental N+1 queries;
+                always on when STRICT_LOADING is enabled
+            
+        Returns:
+            List of Project instances with `tasks` populated
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        try:
+            stmt = (
+                select(Project)
+                .options(selectinload(Project.tasks))
+                .order_by(Project.created_at.desc())
+            )
+            if strict or settings.STRICT_LOADING:
+                stmt = stmt.options(raiseload("*"))
+            return list(self.db.scalars(stmt).all())
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch all projects with tasks: {e}") from e
+    
+    def get_all_summaries(self) -> List[Row]:
+        """Return (id, name) rows for all projects, newest first.
+        
+        Only the two listed columns are selected and no ORM instances are
+        built, which is all a selection menu needs.
+        
+        Returns:
+            List of rows with `id` and `name` attributes
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        try:
+            stmt = select(Project.id, Project.name).order_by(Project.created_at.desc())
+            return list(self.db.execute(stmt).all())
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch project summaries: {e}") from e
+    
+    def get_all_with_task_counts(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Project, int]]:
+        """Return projects paired with their task counts in one query.
+        
+        Counts come from a single GROUP BY over an outer join, so listing
+        projects does not lazy-load each project's tasks. Pagination is
+        applied in SQL, so only the requested window is transferred.
+        
+        Args:
+            offset: Number of projects to skip
+            limit: Maximum number of projects to return, or None for all
+        
+        Returns:
+            List of (Project, task_count) tuples, ordered by created_at descending
+            
+        Raises:
+            DatabaseOperationError: If database operation fails
+        """
+        try:
+            stmt = (
+                select(Project, func.count(Task.id))
+                .options(*_STRICT_LOADING_OPTIONS)
+                .outerjoin(Task, Task.project_id == Project.id)
+                .group_by(Project.id)
+                .order_by(Project.created_at.desc(), Project.id)
+                .offset(offset)
+                .limit(limit)
+            )
+            return [(project, int(count)) for project, count in self.db.execute(stmt)]
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch projects with task counts: {e}") from e
+    
     def update(self, project_id: int, name: str, description: str) -> Project:
-        """Update an existing project.
+        """Update an existing project in a single UPDATE ... RETURNING.
         
         Args:
             project_id: The ID of the project to update
@@ -103,24 +300,76 @@ class ProjectRepository:
         Returns:
             The updated Project ORM model instance
             
+        Raises:
+            ProjectNotFoundError: If project with given ID does not exist
+            DuplicateProjectError: If the new name is already taken
+            DatabaseOperationError: If database operation fails
         """
-        # Fetch project
-        project = self.get_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
-        
-        # Update project
-        project.name = name
-        project.description = description
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(name=name, description=description)
+            .returning(Project)
+        )
         
         try:
-            self.db.commit()
-            self.db.refresh(project)
+            project = self.db.scalars(stmt).one_or_none()
+            if project is None:
+                raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
+            self.db.flush()
             return project
+        except ProjectNotFoundError:
+            raise
         except IntegrityError as e:
             self.db.rollback()
             # Check if it's a unique constraint violation
-            if "unique" in str(e.orig).lower() or "duplicate" in str(e.orig).lower():
+            if is_unique_violation(e):
+                raise DuplicateProjectError(f"Project '{name}' already exists.") from e
+            raise DatabaseOperationError(f"Failed to update project: {e}") from e
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseOperationError(f"Failed to update project: {e}") from e
+    
+    def patch(
+        self,
+        project_id: int,
+        name: Optional[str],
+        description: Optional[str],
+    ) -> Optional[Project]:
+        """Partially update a project in a single UPDATE ... RETURNING.
+        
+        Fields passed as None keep their stored value (via COALESCE), so no
+        prior fetch is needed to merge old and new values.
+        
+        Args:
+            project_id: The ID of the project to update
+            name: New project name, or None to keep the current one
+            description: New project description, or None to keep the current one
+            
+        Returns:
+            The updated Project instance, or None if no project has that ID
+            
+        Raises:
+            DuplicateProjectError: If the new name is already taken
+            DatabaseOperationError: If database operation fails
+        """
+        stmt = (
+            update(Project)
+            .where(Project.id == project_id)
+            .values(
+                name=func.coalesce(name, Project.name),
+                description=func.coalesce(description, Project.description),
+            )
+            .returning(Project)
+        )
+        
+        try:
+            project = self.db.scalars(stmt).one_or_none()
+            self.db.flush()
+            return project
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_unique_violation(e):
                 raise DuplicateProjectError(f"Project '{name}' already exists.") from e
             raise DatabaseOperationError(f"Failed to update project: {e}") from e
         except Exception as e:
@@ -128,10 +377,10 @@ class ProjectRepository:
             raise DatabaseOperationError(f"Failed to update project: {e}") from e
     
     def delete(self, project_id: int) -> None:
-        """Delete a project by ID.
+        """Delete a project by ID in a single DELETE ... RETURNING.
         
-        Tasks associated with the project will be cascade deleted
-        (configured in the ORM model relationship).
+        Tasks associated with the project are removed by the database
+        (ON DELETE CASCADE on tasks.project_id), so they are not loaded.
         
         Args:
             project_id: The ID of the project to delete
@@ -140,14 +389,15 @@ class ProjectRepository:
             ProjectNotFoundError: If project with given ID does not exist
             DatabaseOperationError: If database operation fails
         """
-        # Fetch project
-        project = self.get_by_id(project_id)
-        if project is None:
-            raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
+        stmt = delete(Project).where(Project.id == project_id).returning(Project.id)
         
         try:
-            self.db.delete(project)
-            self.db.commit()
+            deleted_id = self.db.scalar(stmt)
+            if deleted_id is None:
+                raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
+            self.db.flush()
+        except ProjectNotFoundError:
+            raise
         except Exception as e:
             self.db.rollback()
             raise DatabaseOperationError(f"Failed to delete project: {e}") from e
@@ -167,12 +417,11 @@ class ProjectRepository:
             DatabaseOperationError: If database operation fails
         """
         try:
-            stmt = select(Project).where(Project.name == name)
-            if exclude_id is not None:
-                stmt = stmt.where(Project.id != exclude_id)
-            
-            result = self.db.scalar(stmt)
-            return result is not None
+            if exclude_id is None:
+                return self.db.scalar(_EXISTS_BY_NAME, {"name": name}) is not None
+            return self.db.scalar(
+                _EXISTS_BY_NAME_EXCLUDING, {"name": name, "exclude_id": exclude_id}
+            ) is not None
         except Exception as e:
             raise DatabaseOperationError(f"Failed to check project name existence: {e}") from e
 
@@ -3,17 +3,19 @@
 Implements the Repository Pattern for Task entity using SQLAlchemy 2.0 style
 queries (`select` / `session.execute` / `session.scalar`). Business validation
 is expected to live in the service layer; this repository focuses on data
-access and database error translation.
+access and database error translation. Writes are flushed, not committed: the
+session's owner (`get_db` / `session_scope`) commits once per unit of work.
 """
 
 from __future__ import annotations
 
-from datetime import date
-from typing import List, Optional
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, bindparam, func, lambda_stmt, literal, select, update
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 from app.exceptions import (
     DatabaseOperationError,
@@ -23,6 +25,24 @@ from app.exceptions import (
 )
 from app.models.project import Project
 from app.models.task import Task
+from app.repositories.utils import is_unique_violation
+
+# Name-existence probes, built once as lambda statements so each call skips
+# constructing the expression tree
+_EXISTS_IN_PROJECT = lambda_stmt(
+    lambda: select(literal(1))
+    .where(Task.project_id == bindparam("project_id"), Task.name == bindparam("name"))
+    .limit(1)
+)
+_EXISTS_IN_PROJECT_EXCLUDING = lambda_stmt(
+    lambda: select(literal(1))
+    .where(
+        Task.project_id == bindparam("project_id"),
+        Task.name == bindparam("name"),
+        Task.id != bindparam("exclude_id"),
+    )
+    .limit(1)
+)
 
 
 class TaskRepository:
@@ -64,8 +84,7 @@ class TaskRepository:
         """
         # Verify project exists
         try:
-            proj_stmt = select(Project).where(Project.id == project_id)
-            project = self.db.scalar(proj_stmt)
+            project = self.db.get(Project, project_id)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to verify project existence: {e}") from e
 
@@ -82,13 +101,14 @@ class TaskRepository:
 
         try:
             self.db.add(task)
-            self.db.commit()
-            self.db.refresh(task)
+            # No refresh: the primary key comes back from the INSERT and the
+            # timestamps are generated client-side
+            self.db.flush()
             return task
         except IntegrityError as e:
             self.db.rollback()
             # Detect unique constraint violation
-            if "unique" in str(e.orig).lower() or "duplicate" in str(e.orig).lower():
+            if is_unique_violation(e):
                 raise DuplicateTaskError(f"Task '{name}' already exists in project {project_id}.") from e
             raise DatabaseOperationError(f"Failed to create task: {e}") from e
         except Exception as e:
@@ -99,12 +119,15 @@ class TaskRepository:
         """Fetch a task by ID scoped to a specific project.
 
         Returns `None` when no such task exists or it does not belong to the project.
+        Lookups go through the session identity map before hitting the database.
         """
         try:
-            stmt = select(Task).where(Task.id == task_id, Task.project_id == project_id)
-            return self.db.scalar(stmt)
+            task = self.db.get(Task, task_id)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch task by id: {e}") from e
+        if task is None or task.project_id != project_id:
+            return None
+        return task
 
     def get_all_by_project(self, project_id: int) -> List[Task]:
         """Return all tasks for a specific project ordered by `created_at` desc.
@@ -113,8 +136,7 @@ class TaskRepository:
         """
         # ensure project exists
         try:
-            proj_stmt = select(Project).where(Project.id == project_id)
-            project = self.db.scalar(proj_stmt)
+            project = self.db.get(Project, project_id)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to verify project existence: {e}") from e
 
@@ -128,6 +150,44 @@ class TaskRepository:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch tasks for project {project_id}: {e}") from e
 
+    def get_summaries_by_project(self, project_id: int) -> List[Row]:
+        """Return (id, name, status) rows for a project's tasks, newest first.
+
+        Selects only the columns shown in task selection menus and builds no
+        ORM instances. Unlike `get_all_by_project`, a missing project simply
+        yields an empty list.
+        """
+        try:
+            stmt = (
+                select(Task.id, Task.name, Task.status)
+                .where(Task.project_id == project_id)
+                .order_by(Task.created_at.desc())
+            )
+            return list(self.db.execute(stmt).all())
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch task summaries for project {project_id}: {e}") from e
+
+    def get_all_by_projects(self, project_ids: Iterable[int]) -> Dict[int, List[Task]]:
+        """Return tasks for several projects in one query, grouped by project ID.
+
+        Uses a single `WHERE project_id IN (...)` instead of one query per
+        project. Projects without tasks are absent from the result; tasks keep
+        the `created_at` desc order of `get_all_by_project`.
+        """
+        ids = list(project_ids)
+        if not ids:
+            return {}
+        try:
+            stmt = select(Task).where(Task.project_id.in_(ids)).order_by(Task.created_at.desc())
+            tasks = self.db.scalars(stmt).all()
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch tasks for projects: {e}") from e
+
+        grouped: Dict[int, List[Task]] = defaultdict(list)
+        for task in tasks:
+            grouped[task.project_id].append(task)
+        return dict(grouped)
+
     def get_all(self) -> List[Task]:
         """Return all tasks across all projects, with project relationship eagerly loaded.
 
@@ -140,6 +200,27 @@ class TaskRepository:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch all tasks: {e}") from e
 
+    def get_all_with_projects(self, offset: int = 0, limit: Optional[int] = None) -> List[Task]:
+        """Return tasks with their project joined in, ordered by project.
+
+        The project is loaded in the same SELECT (a JOIN), and rows come back
+        grouped by `project_id` (newest task first within each project) so
+        callers can group them in a single pass. `offset`/`limit` select a
+        page of that ordering in SQL.
+        """
+        try:
+            stmt = (
+                select(Task)
+                .options(joinedload(Task.project))
+                .order_by(Task.project_id, Task.created_at.desc(), Task.id)
+                .offset(offset)
+                .limit(limit)
+            )
+            result = self.db.scalars(stmt)
+            return list(result.all())
+        except Exception as e:
+            raise DatabaseOperationError(f"Failed to fetch all tasks: {e}") from e
+
     def update(
         self,
         task_id: int,
@@ -154,8 +235,7 @@ class TaskRepository:
         """
         # Fetch task
         try:
-            stmt = select(Task).where(Task.id == task_id)
-            task = self.db.scalar(stmt)
+            task = self.db.get(Task, task_id)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch task for update: {e}") from e
 
@@ -168,19 +248,59 @@ class TaskRepository:
         task.status = status
         task.deadline = deadline
 
+        # No refresh: the session already holds the values just written,
+        # including the client-side updated_at
         try:
-            self.db.commit()
-            self.db.refresh(task)
+            self.db.flush()
             return task
         except IntegrityError as e:
             self.db.rollback()
-            if "unique" in str(e.orig).lower() or "duplicate" in str(e.orig).lower():
+            if is_unique_violation(e):
                 raise DuplicateTaskError(f"Task '{name}' already exists in project {task.project_id}.") from e
             raise DatabaseOperationError(f"Failed to update task: {e}") from e
         except Exception as e:
             self.db.rollback()
             raise DatabaseOperationError(f"Failed to update task: {e}") from e
 
+    def patch(
+        self,
+        project_id: int,
+        task_id: int,
+        name: Optional[str],
+        description: Optional[str],
+        status: Optional[str],
+        deadline: Optional[date],
+    ) -> Optional[Task]:
+        """Partially update a task in a single UPDATE ... RETURNING.
+
+        Fields passed as None keep their stored value (via COALESCE). Returns
+        `None` when the task does not exist or does not belong to the project.
+        """
+        stmt = (
+            update(Task)
+            .where(Task.id == task_id, Task.project_id == project_id)
+            .values(
+                name=func.coalesce(name, Task.name),
+                description=func.coalesce(description, Task.description),
+                status=func.coalesce(status, Task.status),
+                deadline=func.coalesce(deadline, Task.deadline),
+            )
+            .returning(Task)
+        )
+
+        try:
+            task = self.db.scalars(stmt).one_or_none()
+            self.db.flush()
+            return task
+        except IntegrityError as e:
+            self.db.rollback()
+            if is_unique_violation(e):
+                raise DuplicateTaskError(f"Task '{name}' already exists in project {project_id}.") from e
+            raise DatabaseOperationError(f"Failed to update task: {e}") from e
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseOperationError(f"Failed to update task: {e}") from e
+
     def update_status(self, task_id: int, status: str) -> Task:
         """Update only the `status` field of a task.
 
@@ -188,8 +308,7 @@ class TaskRepository:
         `TaskNotFoundError` when the task does not exist.
         """
         try:
-            stmt = select(Task).where(Task.id == task_id)
-            task = self.db.scalar(stmt)
+            task = self.db.get(Task, task_id)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch task for status update: {e}") from e
 
@@ -199,8 +318,7 @@ class TaskRepository:
         task.status = status
 
         try:
-            self.db.commit()
-            self.db.refresh(task)
+            self.db.flush()
             return task
         except Exception as e:
             self.db.rollback()
@@ -213,17 +331,16 @@ class TaskRepository:
         to the project.
         """
         try:
-            stmt = select(Task).where(Task.id == task_id, Task.project_id == project_id)
-            task = self.db.scalar(stmt)
+            task = self.db.get(Task, task_id)
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch task for deletion: {e}") from e
 
-        if task is None:
+        if task is None or task.project_id != project_id:
             raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}.")
 
         try:
             self.db.delete(task)
-            self.db.commit()
+            self.db.flush()
         except Exception as e:
             self.db.rollback()
             raise DatabaseOperationError(f"Failed to delete task: {e}") from e
@@ -235,11 +352,11 @@ class TaskRepository:
         when updating a task).
         """
         try:
-            stmt = select(Task).where(Task.project_id == project_id, Task.name == name)
-            if exclude_id is not None:
-                stmt = stmt.where(Task.id != exclude_id)
-            existing = self.db.scalar(stmt)
-            return existing is not None
+            params = {"project_id": project_id, "name": name}
+            if exclude_id is None:
+                return self.db.scalar(_EXISTS_IN_PROJECT, params) is not None
+            params["exclude_id"] = exclude_id
+            return self.db.scalar(_EXISTS_IN_PROJECT_EXCLUDING, params) is not None
         except Exception as e:
             raise DatabaseOperationError(f"Failed to check task name existence: {e}") from e
 
@@ -263,6 +380,38 @@ class TaskRepository:
         except Exception as e:
             raise DatabaseOperationError(f"Failed to fetch overdue tasks: {e}") from e
 
+    def close_overdue(self, closed_at: datetime) -> List[Tuple[str, str]]:
+        """Mark every overdue task as done in a single UPDATE.
+
+        Overdue means deadline < today and status != 'done' (same criteria as
+        `get_overdue_tasks`). Returns `(task_name, project_name)` for each
+        closed task, using one UPDATE ... RETURNING plus one lookup of the
+        affected project names.
+        """
+        today = date.today()
+        stmt = (
+            update(Task)
+            .where(Task.deadline.isnot(None))
+            .where(Task.deadline < today)
+            .where(Task.status != "done")
+            .values(status="done", closed_at=closed_at)
+            .returning(Task.name, Task.project_id)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            closed = self.db.execute(stmt).all()
+            names = {}
+            if closed:
+                name_stmt = select(Project.id, Project.name).where(
+                    Project.id.in_({project_id for _, project_id in closed})
+                )
+                names = dict(self.db.execute(name_stmt).all())
+        except Exception as e:
+            self.db.rollback()
+            raise DatabaseOperationError(f"Failed to close overdue tasks: {e}") from e
+
+        return [(name, names.get(project_id, str(project_id))) for name, project_id in closed]
+
     def count_by_project(self, project_id: int) -> int:
         """Return the number of tasks for the given project."""
         try:
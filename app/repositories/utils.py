@@ -0,0 +1,30 @@
+"""Helpers shared by the repository implementations."""
+
+import sqlite3
+
+from sqlalchemy.exc import IntegrityError
+
+# SQLSTATE for unique_violation (PostgreSQL and other SQL-standard drivers)
+_UNIQUE_VIOLATION_SQLSTATE = "23505"
+
+
+def is_unique_violation(error: IntegrityError) -> bool:
+    """Return True if `error` was raised by a unique constraint or index.
+    
+    Classifies by the driver's structured error code (psycopg2 `pgcode`)
+    rather than matching words in the message, which also matched other
+    constraints whose names contain "unique" or "duplicate". SQLite reports
+    no code, so its fixed "UNIQUE constraint failed" message is checked.
+    
+    Args:
+        error: The IntegrityError raised by SQLAlchemy
+        
+    Returns:
+        True for unique violations, False for any other integrity error
+    """
+    orig = error.orig
+    if getattr(orig, "pgcode", None) == _UNIQUE_VIOLATION_SQLSTATE:
+        return True
+    if isinstance(orig, sqlite3.IntegrityError):
+        return bool(orig.args) and str(orig.args[0]).startswith("UNIQUE constraint failed")
+    return False
@@ -1,9 +1,11 @@
 """Project service wrapper that delegates to the unified TodoService."""
 
-from typing import List
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import Row
 
 from app.models.project import Project
-from app.repositories import ProjectRepository, TaskRepository
+from app.repositories import ProjectListRow, ProjectRepository, TaskRepository
 from app.services.todo_service import TodoService
 
 
@@ -17,14 +19,34 @@ class ProjectService:
         """Create a new project with validation and business rules."""
         return self._service.create_project(name, description)
 
-    def list_projects(self) -> List[Project]:
+    def create_projects(self, items: Iterable[Tuple[str, str]]) -> List[int]:
+        """Create several (name, description) projects in one batch; returns their IDs."""
+        return self._service.create_projects(items)
+
+    def list_projects(self) -> List[ProjectListRow]:
         """Return all projects."""
         return self._service.list_projects()
 
+    def list_project_summaries(self) -> List[Row]:
+        """Return (id, name) rows for all projects."""
+        return self._service.list_project_summaries()
+
+    def list_projects_with_task_counts(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Project, int]]:
+        """Return projects paired with their task counts, optionally one page."""
+        return self._service.list_projects_with_task_counts(offset=offset, limit=limit)
+
     def get_project(self, project_id: int) -> Project:
         """Fetch a project by ID or raise if missing."""
         return self._service.get_project(project_id)
 
+    def get_project_with_tasks(self, project_id: int) -> Project:
+        """Fetch a project by ID with its tasks loaded, or raise if missing."""
+        return self._service.get_project_with_tasks(project_id)
+
     def edit_project(self, project_id: int, new_name: str, new_description: str) -> Project:
         """Update a project's name and description."""
         return self._service.edit_project(project_id, new_name, new_description)
@@ -1,6 +1,8 @@
 """Task service wrapper that delegates to the unified TodoService."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import Row
 
 from app.models.task import Task
 from app.repositories import ProjectRepository, TaskRepository
@@ -28,10 +30,22 @@ class TaskService:
         """Return all tasks for a project."""
         return self._service.list_tasks(project_id)
 
+    def list_task_summaries(self, project_id: int) -> List[Row]:
+        """Return (id, name, status) rows for a project's tasks."""
+        return self._service.list_task_summaries(project_id)
+
+    def list_tasks_for_projects(self, project_ids: Iterable[int]) -> Dict[int, List[Task]]:
+        """Return tasks for several projects, keyed by project ID."""
+        return self._service.list_tasks_for_projects(project_ids)
+
     def list_all_tasks(self) -> List[Task]:
         """Return all tasks across all projects."""
         return self._service.list_all_tasks()
 
+    def list_all_tasks_with_projects(self, offset: int = 0, limit: Optional[int] = None) -> List[Task]:
+        """Return tasks with their projects loaded, ordered by project, optionally one page."""
+        return self._service.list_all_tasks_with_projects(offset=offset, limit=limit)
+
     def get_task(self, project_id: int, task_id: int) -> Task:
         """Fetch a task scoped to a project."""
         return self._service.get_task(project_id, task_id)
@@ -8,10 +8,12 @@ presentation layers free of business logic.
 
 from __future__ import annotations
 
-from datetime import datetime, date
-from typing import List, Optional
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from app.config import MAX_NUMBER_OF_PROJECT, MAX_NUMBER_OF_TASK
+from sqlalchemy import Row
+
+from app.config import max_projects, max_tasks
 from app.core.validation import (
     validate_project_description,
     validate_project_name,
@@ -30,7 +32,7 @@ from app.exceptions import (
 )
 from app.models.project import Project
 from app.models.task import Task
-from app.repositories import ProjectRepository, TaskRepository
+from app.repositories import ProjectListRow, ProjectRepository, TaskRepository
 
 
 class TodoService:
@@ -44,22 +46,53 @@ class TodoService:
     # Project operations
     # ------------------------
     def create_project(self, name: str, description: str) -> Project:
-        """Create a project after enforcing limits and uniqueness."""
+        """Create a project after enforcing limits and uniqueness.
+
+        Name uniqueness is enforced by the database constraint on insert;
+        the repository maps the violation to DuplicateProjectError.
+        """
         validate_project_name(name)
         validate_project_description(description)
 
-        if self.project_repository.count() >= MAX_NUMBER_OF_PROJECT:
-            raise ProjectLimitError(f"Cannot create more than {MAX_NUMBER_OF_PROJECT} projects.")
-
-        if self.project_repository.exists_by_name(name):
-            raise DuplicateProjectError(f"Project '{name}' already exists.")
+        limit = max_projects()
+        if self.project_repository.count() >= limit:
+            raise ProjectLimitError(f"Cannot create more than {limit} projects.")
 
         return self.project_repository.create(name=name, description=description)
 
-    def list_projects(self) -> List[Project]:
-        """Return all projects."""
+    def create_projects(self, items: Iterable[Tuple[str, str]]) -> List[int]:
+        """Create several projects at once; all are created or none are.
+
+        Every (name, description) pair is validated first, and the project
+        limit is checked against the whole batch before a single INSERT.
+        """
+        items = list(items)
+        for name, description in items:
+            validate_project_name(name)
+            validate_project_description(description)
+
+        limit = max_projects()
+        if self.project_repository.count() + len(items) > limit:
+            raise ProjectLimitError(f"Cannot create more than {limit} projects.")
+
+        return self.project_repository.create_many(items)
+
+    def list_projects(self) -> List[ProjectListRow]:
+        """Return all projects as lightweight (id, name, description, created_at) rows."""
         return self.project_repository.get_all()
 
+    def list_project_summaries(self) -> List[Row]:
+        """Return (id, name) rows for all projects, for selection menus."""
+        return self.project_repository.get_all_summaries()
+
+    def list_projects_with_task_counts(
+        self,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Project, int]]:
+        """Return a window of projects with their task counts, without loading tasks."""
+        return self.project_repository.get_all_with_task_counts(offset=offset, limit=limit)
+
     def get_project(self, project_id: int) -> Project:
         """Fetch a project or raise if missing."""
         project = self.project_repository.get_by_id(project_id)
@@ -67,20 +100,46 @@ class TodoService:
             raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
         return project
 
+    def get_project_with_tasks(self, project_id: int) -> Project:
+        """Fetch a project with its tasks eager-loaded, or raise if missing."""
+        project = self.project_repository.get_by_id_with_tasks(project_id)
+        if project is None:
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
+        return project
+
     def edit_project(self, project_id: int, new_name: str, new_description: str) -> Project:
         """Update project details with validation and uniqueness checks."""
         validate_project_name(new_name)
         validate_project_description(new_description)
-        self.get_project(project_id)
 
         if self.project_repository.exists_by_name(new_name, exclude_id=project_id):
             raise DuplicateProjectError(f"Project '{new_name}' already exists.")
 
         return self.project_repository.update(project_id, new_name, new_description)
 
+    def patch_project(
+        self,
+        project_id: int,
+        new_name: Optional[str],
+        new_description: Optional[str],
+    ) -> Project:
+        """Update only the provided project fields; None keeps the stored value.
+
+        Name uniqueness is enforced by the database constraint, so the update
+        takes a single round-trip.
+        """
+        if new_name is not None:
+            validate_project_name(new_name)
+        if new_description is not None:
+            validate_project_description(new_description)
+
+        project = self.project_repository.patch(project_id, new_name, new_description)
+        if project is None:
+            raise ProjectNotFoundError(f"Project with ID {project_id} not found.")
+        return project
+
     def delete_project(self, project_id: int) -> None:
-        """Delete a project after verifying it exists."""
-        self.get_project(project_id)
+        """Delete a project; the repository raises if it does not exist."""
         self.project_repository.delete(project_id)
 
     # ------------------------
@@ -103,8 +162,9 @@ class TodoService:
         normalized_status = validate_task_status(status)
         parsed_deadline = self._parse_deadline(deadline)
 
-        if self.task_repository.count_by_project(project_id) >= MAX_NUMBER_OF_TASK:
-            raise TaskLimitError(f"Cannot create more than {MAX_NUMBER_OF_TASK} tasks in project {project_id}.")
+        limit = max_tasks()
+        if self.task_repository.count_by_project(project_id) >= limit:
+            raise TaskLimitError(f"Cannot create more than {limit} tasks in project {project_id}.")
 
         if self.task_repository.exists_by_name_in_project(project_id, name):
             raise DuplicateTaskError(f"Task '{name}' already exists in project {project_id}.")
@@ -116,10 +176,22 @@ class TodoService:
         self.get_project(project_id)
         return self.task_repository.get_all_by_project(project_id)
 
+    def list_task_summaries(self, project_id: int) -> List[Row]:
+        """Return (id, name, status) rows for a project's tasks, for selection menus."""
+        return self.task_repository.get_summaries_by_project(project_id)
+
+    def list_tasks_for_projects(self, project_ids: Iterable[int]) -> Dict[int, List[Task]]:
+        """List tasks for several projects at once, keyed by project ID."""
+        return self.task_repository.get_all_by_projects(project_ids)
+
     def list_all_tasks(self) -> List[Task]:
         """List all tasks across all projects."""
         return self.task_repository.get_all()
 
+    def list_all_tasks_with_projects(self, offset: int = 0, limit: Optional[int] = None) -> List[Task]:
+        """List tasks with their projects loaded, ordered by project, optionally one page."""
+        return self.task_repository.get_all_with_projects(offset=offset, limit=limit)
+
     def get_task(self, project_id: int, task_id: int) -> Task:
         """Fetch a task scoped to a project or raise if missing."""
         task = self.task_repository.get_by_id(project_id, task_id)
@@ -149,6 +221,39 @@ class TodoService:
 
         return self.task_repository.update(task_id, new_name, new_description, normalized_status, parsed_deadline)
 
+    def patch_task(
+        self,
+        project_id: int,
+        task_id: int,
+        new_name: Optional[str],
+        new_description: Optional[str],
+        new_status: Optional[str],
+        new_deadline: Optional[str],
+    ) -> Task:
+        """Update only the provided task fields; None keeps the stored value.
+
+        Name uniqueness within the project is enforced by the database
+        constraint, so the update takes a single round-trip.
+        """
+        if new_name is not None:
+            validate_task_name(new_name)
+        if new_description is not None:
+            validate_task_description(new_description)
+        normalized_status = validate_task_status(new_status) if new_status is not None else None
+        parsed_deadline = self._parse_deadline(new_deadline)
+
+        task = self.task_repository.patch(
+            project_id,
+            task_id,
+            new_name,
+            new_description,
+            normalized_status,
+            parsed_deadline,
+        )
+        if task is None:
+            raise TaskNotFoundError(f"Task with ID {task_id} not found in project {project_id}.")
+        return task
+
     def edit_task_status(self, project_id: int, task_id: int, new_status: str) -> Task:
         """Update only the task status."""
         self.get_task(project_id, task_id)
@@ -165,7 +270,4 @@ class TodoService:
     # ------------------------
     def _parse_deadline(self, deadline: Optional[str]) -> Optional[date]:
         """Validate and parse a deadline string into a date."""
-        validate_task_deadline(deadline)
-        if deadline is None or str(deadline).strip() == "":
-            return None
-        return datetime.strptime(str(deadline).strip(), "%Y-%m-%d").date()
+        return validate_task_deadline(deadline)